@@ -7,6 +7,9 @@ Pokrenite pipeline GUI.
 Dvostruki klik na ovu datoteku ili pokrenite: python launch.py
 """
 
+from __future__ import annotations
+
+import functools
 import os
 import subprocess
 import sys
@@ -14,18 +17,21 @@ from pathlib import Path
 
 PROJECT_ROOT = Path(__file__).resolve().parent
 
+# Interpreter location inside a venv, relative to the venv directory
+if sys.platform == "win32":
+    _VENV_PYTHON = os.path.join("Scripts", "python.exe")
+else:
+    _VENV_PYTHON = os.path.join("bin", "python")
+
 
+@functools.lru_cache(maxsize=1)
 def find_venv_python() -> str | None:
     """Find the Python executable in the virtual environment."""
-    if sys.platform == "win32":
-        suffix = os.path.join("Scripts", "python.exe")
-    else:
-        suffix = os.path.join("bin", "python")
-
+    root = str(PROJECT_ROOT)
     for venv_name in (".venv", "venv"):
-        candidate = PROJECT_ROOT / venv_name / suffix
-        if candidate.exists():
-            return str(candidate)
+        candidate = os.path.join(root, venv_name, _VENV_PYTHON)
+        if os.path.isfile(candidate):
+            return candidate
 
     return None
 
@@ -43,6 +49,17 @@ def main() -> None:
         sys.exit(1)
 
     os.chdir(str(PROJECT_ROOT))
+
+    # Already running on the venv's interpreter: start the GUI in-process
+    # instead of paying for a second interpreter start-up. Compare prefixes,
+    # not executables — the venv's python is usually a symlink to the base one.
+    venv_dir = Path(python).parent.parent
+    if Path(sys.prefix).resolve() == venv_dir.resolve():
+        import runpy
+
+        runpy.run_module("doc_pipeline.gui", run_name="__main__", alter_sys=True)
+        return
+
     result = subprocess.run([python, "-m", "doc_pipeline.gui"])
     sys.exit(result.returncode)
 
@@ -1,185 +1,314 @@
-"""Build the aneks_template.docx programmatically using python-docx.
+"""Build the aneks_template.docx by writing the WordprocessingML parts directly.
 
 This creates a docxtpl-compatible template that mirrors the Crowe annex structure
-(U-25-09) with Jinja2 placeholders for variable content.
+(U-25-09) with Jinja2 placeholders for variable content. The document is small
+and fixed, so the XML is assembled from strings at import time and zipped into
+place without going through python-docx.
 """
 
 from __future__ import annotations
 
+import functools
 from pathlib import Path
-
-from docx import Document
-from docx.enum.section import WD_ORIENT
-from docx.enum.table import WD_TABLE_ALIGNMENT
-from docx.enum.text import WD_ALIGN_PARAGRAPH
-from docx.oxml.ns import qn
-from docx.shared import Cm, Mm, Pt
+from xml.sax.saxutils import escape
+from zipfile import ZIP_DEFLATED, ZipFile
 
 TEMPLATE_DIR = Path(__file__).resolve().parent.parent / "templates" / "default"
 TEMPLATE_PATH = TEMPLATE_DIR / "aneks_template.docx"
 
+_W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+_R_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+
+# A4 with 2cm margins, in twentieths of a point
+_PAGE_WIDTH = 11906
+_PAGE_HEIGHT = 16838
+_MARGIN = 1134
+_TEXT_WIDTH = _PAGE_WIDTH - 2 * _MARGIN
+
+# Spacing (pt) standing in for one empty 10pt line between paragraphs
+_GAP = 16
+
+_BORDER_EDGES = ("top", "left", "bottom", "right", "insideH", "insideV")
+
+# Cell borders for the signature tables: every edge suppressed
+_NO_BORDERS_XML = (
+    "<w:tcBorders>"
+    + "".join(
+        f'<w:{edge} w:val="none" w:sz="0" w:space="0" w:color="auto"/>'
+        for edge in _BORDER_EDGES
+    )
+    + "</w:tcBorders>"
+)
+
+
+# ── Static package parts ────────────────────────────────────────────
+
+_CONTENT_TYPES_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" '
+    'ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/word/document.xml" ContentType="application/'
+    'vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+    '<Override PartName="/word/styles.xml" ContentType="application/'
+    'vnd.openxmlformats-officedocument.wordprocessingml.styles+xml"/>'
+    "</Types>"
+).encode("utf-8")
+
+_ROOT_RELS_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/'
+    '2006/relationships/officeDocument" Target="word/document.xml"/>'
+    "</Relationships>"
+).encode("utf-8")
+
+_DOCUMENT_RELS_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/'
+    '2006/relationships/styles" Target="styles.xml"/>'
+    "</Relationships>"
+).encode("utf-8")
+
+# Normal = Arial 10pt, 4pt after / 0pt before; "Table Grid" = single 0.5pt borders
+_STYLES_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    f'<w:styles xmlns:w="{_W_NS}">'
+    "<w:docDefaults>"
+    '<w:rPrDefault><w:rPr><w:rFonts w:ascii="Arial" w:hAnsi="Arial" w:cs="Arial"/>'
+    '<w:sz w:val="20"/><w:szCs w:val="20"/><w:lang w:val="hr-HR"/></w:rPr></w:rPrDefault>'
+    "<w:pPrDefault><w:pPr/></w:pPrDefault>"
+    "</w:docDefaults>"
+    '<w:style w:type="paragraph" w:default="1" w:styleId="Normal">'
+    '<w:name w:val="Normal"/><w:qFormat/>'
+    '<w:pPr><w:spacing w:before="0" w:after="80"/></w:pPr>'
+    '<w:rPr><w:rFonts w:ascii="Arial" w:hAnsi="Arial" w:cs="Arial"/>'
+    '<w:sz w:val="20"/></w:rPr>'
+    "</w:style>"
+    '<w:style w:type="character" w:default="1" w:styleId="DefaultParagraphFont">'
+    '<w:name w:val="Default Paragraph Font"/><w:uiPriority w:val="1"/>'
+    "<w:semiHidden/><w:unhideWhenUsed/>"
+    "</w:style>"
+    '<w:style w:type="table" w:default="1" w:styleId="TableNormal">'
+    '<w:name w:val="Normal Table"/><w:uiPriority w:val="99"/>'
+    "<w:semiHidden/><w:unhideWhenUsed/>"
+    '<w:tblPr><w:tblInd w:w="0" w:type="dxa"/><w:tblCellMar>'
+    '<w:top w:w="0" w:type="dxa"/><w:left w:w="108" w:type="dxa"/>'
+    '<w:bottom w:w="0" w:type="dxa"/><w:right w:w="108" w:type="dxa"/>'
+    "</w:tblCellMar></w:tblPr>"
+    "</w:style>"
+    '<w:style w:type="table" w:styleId="TableGrid">'
+    '<w:name w:val="Table Grid"/><w:basedOn w:val="TableNormal"/><w:uiPriority w:val="59"/>'
+    '<w:pPr><w:spacing w:after="0" w:line="240" w:lineRule="auto"/></w:pPr>'
+    "<w:tblPr><w:tblBorders>"
+    + "".join(
+        f'<w:{edge} w:val="single" w:sz="4" w:space="0" w:color="auto"/>'
+        for edge in _BORDER_EDGES
+    )
+    + "</w:tblBorders></w:tblPr>"
+    "</w:style>"
+    "</w:styles>"
+).encode("utf-8")
+
 
-def _set_cell_text(cell, text: str, bold: bool = False, size: int = 10) -> None:
-    """Set cell text with consistent formatting."""
-    cell.text = ""
-    p = cell.paragraphs[0]
-    run = p.add_run(text)
-    run.font.name = "Arial"
-    run.font.size = Pt(size)
-    run.bold = bold
+# ── XML fragment helpers ────────────────────────────────────────────
+
+
+def _run(text: str, bold: bool = False, size: int = 10) -> str:
+    """Return a ``<w:r>``; newlines become ``<w:br/>``.
+
+    Font and size come from the Normal style, so ``<w:rPr>`` is only emitted
+    for bold text or a non-default size.
+    """
+    props = ("<w:b/>" if bold else "") + (f'<w:sz w:val="{size * 2}"/>' if size != 10 else "")
+    rpr = f"<w:rPr>{props}</w:rPr>" if props else ""
+    body = "<w:br/>".join(
+        f'<w:t xml:space="preserve">{escape(line)}</w:t>' for line in text.split("\n")
+    ) if text else ""
+    return f"<w:r>{rpr}{body}</w:r>"
+
+
+def _para(
+    runs: str,
+    *,
+    center: bool = False,
+    space_after: int | None = None,
+    space_before: int | None = None,
+) -> str:
+    """Wrap run XML in a ``<w:p>`` with optional spacing (pt) and centering."""
+    ppr = ""
+    if space_before is not None or space_after is not None:
+        attrs = ""
+        if space_before is not None:
+            attrs += f' w:before="{space_before * 20}"'
+        if space_after is not None:
+            attrs += f' w:after="{space_after * 20}"'
+        ppr += f"<w:spacing{attrs}/>"
+    if center:
+        ppr += '<w:jc w:val="center"/>'
+    if ppr:
+        ppr = f"<w:pPr>{ppr}</w:pPr>"
+    return f"<w:p>{ppr}{runs}</w:p>"
 
 
 def _add_para(
-    doc: Document,
+    body: list[str],
     text: str,
     *,
     bold: bool = False,
-    alignment: WD_ALIGN_PARAGRAPH | None = None,
+    center: bool = False,
     space_after: int | None = None,
     space_before: int | None = None,
     font_size: int = 10,
 ) -> None:
-    """Add a paragraph with consistent formatting."""
-    p = doc.add_paragraph()
-    run = p.add_run(text)
-    run.font.name = "Arial"
-    run.font.size = Pt(font_size)
-    run.bold = bold
-    if alignment is not None:
-        p.alignment = alignment
-    fmt = p.paragraph_format
-    if space_after is not None:
-        fmt.space_after = Pt(space_after)
-    if space_before is not None:
-        fmt.space_before = Pt(space_before)
+    """Append a single-run paragraph."""
+    body.append(
+        _para(
+            _run(text, bold, font_size),
+            center=center,
+            space_after=space_after,
+            space_before=space_before,
+        )
+    )
 
 
 def _add_mixed_para(
-    doc: Document,
+    body: list[str],
     segments: list[tuple[str, bool]],
     *,
-    alignment: WD_ALIGN_PARAGRAPH | None = None,
+    center: bool = False,
     space_after: int | None = None,
     space_before: int | None = None,
 ) -> None:
-    """Add a paragraph with mixed bold/normal runs."""
-    p = doc.add_paragraph()
-    for text, bold in segments:
-        run = p.add_run(text)
-        run.font.name = "Arial"
-        run.font.size = Pt(10)
-        run.bold = bold
-    if alignment is not None:
-        p.alignment = alignment
-    fmt = p.paragraph_format
-    if space_after is not None:
-        fmt.space_after = Pt(space_after)
-    if space_before is not None:
-        fmt.space_before = Pt(space_before)
+    """Append a paragraph with mixed bold/normal runs."""
+    body.append(
+        _para(
+            "".join(_run(text, bold) for text, bold in segments),
+            center=center,
+            space_after=space_after,
+            space_before=space_before,
+        )
+    )
 
 
-def build_template() -> Path:
-    """Create the annex .docx template with Jinja2 placeholders."""
-    doc = Document()
-
-    # ── Page setup (A4, 2cm margins) ────────────────────────────────
-    section = doc.sections[0]
-    section.page_width = Mm(210)
-    section.page_height = Mm(297)
-    section.orientation = WD_ORIENT.PORTRAIT
-    section.top_margin = Cm(2)
-    section.bottom_margin = Cm(2)
-    section.left_margin = Cm(2)
-    section.right_margin = Cm(2)
-
-    # ── Set default font ────────────────────────────────────────────
-    style = doc.styles["Normal"]
-    font = style.font
-    font.name = "Arial"
-    font.size = Pt(10)
-    style.paragraph_format.space_after = Pt(4)
-    style.paragraph_format.space_before = Pt(0)
+@functools.lru_cache(maxsize=None)
+def _cell_xml(text: str, bold: bool, width: int, borderless: bool) -> str:
+    """Return a ``<w:tc>`` holding one paragraph; repeated cells share the string."""
+    borders = _NO_BORDERS_XML if borderless else ""
+    return (
+        f'<w:tc><w:tcPr><w:tcW w:w="{width}" w:type="dxa"/>{borders}</w:tcPr>'
+        f"{_para(_run(text, bold))}</w:tc>"
+    )
+
+
+def _add_table(
+    body: list[str],
+    rows: list[list[tuple[str, bool]]],
+    *,
+    grid: bool = False,
+    borderless: bool = False,
+) -> None:
+    """Append a centered table; each cell is a ``(text, bold)`` tuple."""
+    cols = len(rows[0])
+    col_width = _TEXT_WIDTH // cols
+    tbl_pr = (
+        "<w:tblPr>"
+        + ('<w:tblStyle w:val="TableGrid"/>' if grid else "")
+        + '<w:tblW w:w="0" w:type="auto"/><w:jc w:val="center"/>'
+        '<w:tblLook w:val="04A0" w:firstRow="1" w:lastRow="0" w:firstColumn="1" '
+        'w:lastColumn="0" w:noHBand="0" w:noVBand="1"/>'
+        "</w:tblPr>"
+    )
+    tbl_grid = "<w:tblGrid>" + f'<w:gridCol w:w="{col_width}"/>' * cols + "</w:tblGrid>"
+    trs = "".join(
+        "<w:tr>"
+        + "".join(_cell_xml(text, bold, col_width, borderless) for text, bold in row)
+        + "</w:tr>"
+        for row in rows
+    )
+    body.append(f"<w:tbl>{tbl_pr}{tbl_grid}{trs}</w:tbl>")
+
+
+# ── Document body ───────────────────────────────────────────────────
+
+
+def _document_xml() -> str:
+    """Assemble ``word/document.xml`` for the annex template."""
+    body: list[str] = []
 
     # ── Header block: Client party ──────────────────────────────────
     _add_mixed_para(
-        doc,
+        body,
         [
             ("{{ korisnik_naziv }}", True),
             (", {{ korisnik_adresa }}", True),
             (", OIB: {{ korisnik_oib }}, kojeg zastupa direktor {{ korisnik_direktor }} "
              "(u daljnjem tekstu: Korisnik usluga),", False),
         ],
+        space_after=_GAP,
     )
 
-    _add_para(doc, "")  # blank line
-
-    _add_para(doc, "i", alignment=WD_ALIGN_PARAGRAPH.CENTER)
-
-    _add_para(doc, "")  # blank line
+    _add_para(body, "i", center=True, space_after=_GAP)
 
     # ── Header block: Procudo party ─────────────────────────────────
     _add_mixed_para(
-        doc,
+        body,
         [
             ("{{ davatelj_naziv }}", True),
             (" {{ davatelj_adresa }}, OIB: {{ davatelj_oib }}, kojeg zastupa direktor "
              "{{ davatelj_direktor }}, (u daljnjem tekstu: Izvršitelj usluga),", False),
         ],
+        space_after=_GAP,
     )
 
-    _add_para(doc, "")  # blank line
-
-    _add_para(doc, "zaključili su dana {{ datum_aneksa }} godine.")
-
-    _add_para(doc, "")  # blank line
+    _add_para(body, "zaključili su dana {{ datum_aneksa }} godine.", space_after=_GAP)
 
     # ── Title block ─────────────────────────────────────────────────
     _add_para(
-        doc,
+        body,
         "Anex br. {{ broj_aneksa }} Ugovora br. {{ broj_ugovora }}",
         bold=True,
-        alignment=WD_ALIGN_PARAGRAPH.CENTER,
+        center=True,
         space_after=2,
     )
     _add_para(
-        doc,
+        body,
         "o servisiranju i održavanju",
         bold=True,
-        alignment=WD_ALIGN_PARAGRAPH.CENTER,
+        center=True,
         space_after=2,
     )
     _add_para(
-        doc,
+        body,
         "informacijskog sustava",
         bold=True,
-        alignment=WD_ALIGN_PARAGRAPH.CENTER,
+        center=True,
         space_after=8,
     )
 
     # ── Čl. 1 ───────────────────────────────────────────────────────
-    _add_para(doc, "Čl. 1", bold=True, space_before=8)
-    _add_para(doc, "")
+    _add_para(body, "Čl. 1", bold=True, space_before=8, space_after=_GAP)
     _add_para(
-        doc,
+        body,
         "Ugovorne strane suglasno utvrđuju da su dana {{ datum_ugovora }} "
         "sklopile Ugovor br. {{ broj_ugovora }} o servisiranju i održavanju "
         "informacijskog sustava",
     )
 
     # ── Čl. 2 ───────────────────────────────────────────────────────
-    _add_para(doc, "Čl. 2", bold=True, space_before=8)
-    _add_para(doc, "")
+    _add_para(body, "Čl. 2", bold=True, space_before=8, space_after=_GAP)
     _add_para(
-        doc,
+        body,
         "Ugovorne strane suglasno utvrđuju da se mijenja odredba čl. 3. "
         "gore navedenog Ugovora na način da ista sada glasi:",
+        space_after=_GAP,
     )
-    _add_para(doc, "")
-    _add_para(doc, "    Naknada mjesečnog održavanja", bold=True)
-    _add_para(doc, "")
+    _add_para(body, "    Naknada mjesečnog održavanja", bold=True, space_after=_GAP)
     # Conditional HRK conversion clause
     _add_para(
-        doc,
+        body,
         "{% if valuta_konverzija %}"
         "Dosadašnje cijene usluga bile su izražene u HRK te se konvertiraju u EUR "
         "prema fiksnom tečaju konverzije (1 EUR = 7,53450 HRK) sukladno Zakonu o "
@@ -187,82 +316,64 @@ def build_template() -> Path:
         "{% endif %}"
     )
     _add_para(
-        doc,
+        body,
         "Za usluge koje su definirane u Prilogu 1. ovog Ugovora, Korisnik usluga "
         "će Izvršitelju usluga plaćati mjesečnu naknadu u iznosu od "
         "{{ mjesecna_naknada }} EUR neto.",
     )
 
     # ── Čl. 3 ───────────────────────────────────────────────────────
-    _add_para(doc, "Čl. 3", bold=True, space_before=8)
-    _add_para(doc, "")
+    _add_para(body, "Čl. 3", bold=True, space_before=8, space_after=_GAP)
     _add_para(
-        doc,
+        body,
         "Ugovorne strane suglasno utvrđuju da se mijenja odredba čl. 4 st. 4 "
         "gore navedenog Ugovora na način da ista sada glasi:",
+        space_after=_GAP,
     )
-    _add_para(doc, "")
-    _add_para(doc, "    Obveze Izvršitelja usluga", bold=True)
-    _add_para(doc, "")
+    _add_para(body, "    Obveze Izvršitelja usluga", bold=True, space_after=_GAP)
     _add_mixed_para(
-        doc,
+        body,
         [
             ("(4) Ugovoreni mjesečni fond sati za redovito servisiranje i "
              "održavanje informacijskog sustava je ", False),
             ("{{ ukupno_sati }}", True),
             (" mjesečno:", False),
         ],
+        space_after=_GAP,
     )
-    _add_para(doc, "")
     _add_para(
-        doc,
+        body,
         "{{ l1_sati }} sistem administrator sata (L1) – sistemsko održavanje "
         "radnih stanica, mrežne infrastrukture, printera i hardverske periferije, "
         "pomoć korisnicima pri radu, edukacija korisnika",
+        space_after=_GAP,
     )
-    _add_para(doc, "")
     _add_para(
-        doc,
+        body,
         "{{ l2_sati }} sistem inženjer sat – (L2) – Održavanje i konfiguriranje "
         "komunikacijske mreže, održavanje i konfiguriranje poslužitelja i Office 365 "
         "sustava, savjetodavne usluge",
     )
 
     # ── Čl. 4 ───────────────────────────────────────────────────────
-    _add_para(doc, "Čl. 4.", bold=True, space_before=8)
-    _add_para(doc, "")
+    _add_para(body, "Čl. 4.", bold=True, space_before=8, space_after=_GAP)
     _add_para(
-        doc,
+        body,
         "Ugovorne strane suglasno utvrđuju da se mijenja odredba Priloga 2. "
         "gore navedenog Ugovora na način da ista sada glasi:",
+        space_after=_GAP,
     )
-    _add_para(doc, "")
     _add_para(
-        doc,
+        body,
         "Izračun cijene redovnog servisiranja i održavanja informacijskog sustava",
         bold=True,
+        space_after=_GAP,
     )
-    _add_para(doc, "")
 
     # ── Pricing table ───────────────────────────────────────────────
     # docxtpl {%tr %} tags must be on their own dedicated rows.
     # Structure: header | for-loop-tag row | data row | endfor-tag row
-    table = doc.add_table(rows=4, cols=6)
-    table.alignment = WD_TABLE_ALIGNMENT.CENTER
-    table.style = "Table Grid"
-
-    # Row 0: Header row
     headers = ["Poz.", "Opis", "Oznaka", "Mjera", "Kol.", "Jed. Cijena\n(EUR)"]
-    for i, h in enumerate(headers):
-        cell = table.rows[0].cells[i]
-        _set_cell_text(cell, h, bold=True)
-
-    # Row 1: for-loop opening tag (dedicated row)
-    _set_cell_text(table.rows[1].cells[0], "{%tr for s in stavke %}")
-    for i in range(1, 6):
-        _set_cell_text(table.rows[1].cells[i], "")
-
-    # Row 2: data row with placeholders
     data_cells = [
         "{{ s.pozicija }}",
         "{{ s.opis }}",
@@ -271,117 +382,96 @@ def build_template() -> Path:
         "{{ s.kolicina }}",
         "{{ s.cijena }}",
     ]
-    for i, val in enumerate(data_cells):
-        _set_cell_text(table.rows[2].cells[i], val)
-
-    # Row 3: endfor tag (dedicated row)
-    _set_cell_text(table.rows[3].cells[0], "{%tr endfor %}")
-    for i in range(1, 6):
-        _set_cell_text(table.rows[3].cells[i], "")
+    _add_table(
+        body,
+        [
+            [(h, True) for h in headers],
+            [("{%tr for s in stavke %}", False)] + [("", False)] * 5,
+            [(val, False) for val in data_cells],
+            [("{%tr endfor %}", False)] + [("", False)] * 5,
+        ],
+        grid=True,
+    )
 
-    _add_para(doc, "")
-    _add_para(doc, "{{ vat_note }}")
+    _add_para(body, "{{ vat_note }}", space_before=_GAP)
 
     # ── Čl. 5 ───────────────────────────────────────────────────────
-    _add_para(doc, "Čl. 5.", bold=True, space_before=8)
-    _add_para(doc, "")
+    _add_para(body, "Čl. 5.", bold=True, space_before=8, space_after=_GAP)
     _add_para(
-        doc,
+        body,
         "Ugovorne strane suglasno utvrđuju da ostale odredbe Ugovora "
         "{{ broj_ugovora }} o servisiranju i održavanju informacijskog "
         "sustava ostaju nepromijenjene.",
     )
 
     # ── Čl. 6 ───────────────────────────────────────────────────────
-    _add_para(doc, "Čl. 6.", bold=True, space_before=8)
-    _add_para(doc, "")
+    _add_para(body, "Čl. 6.", bold=True, space_before=8, space_after=_GAP)
     _add_para(
-        doc,
+        body,
         "Ovaj Aneks je sastavljen u 2 istovjetna primjerka, od kojih svaka "
         "ugovorna strana zadržava po 1 primjerak.",
     )
 
     # ── Čl. 7 ───────────────────────────────────────────────────────
-    _add_para(doc, "Čl. 7.", bold=True, space_before=8)
-    _add_para(doc, "")
+    _add_para(body, "Čl. 7.", bold=True, space_before=8, space_after=_GAP)
     _add_para(
-        doc,
+        body,
         "Korisnik usluga i Izvršitelj usluga prihvaćaju prava i obveze "
         "iz ovog Aneksa, te ga u znak obostranog prihvata vlastoručno "
         "potpisuju po ovlaštenim zastupnicima.",
+        space_after=_GAP,
     )
 
-    _add_para(doc, "")
-
     # ── Signature block ─────────────────────────────────────────────
-    _add_para(doc, "U {{ mjesto }}, {{ datum_aneksa }}")
-    _add_para(doc, "")
-    _add_para(doc, "")
-
-    # Create a 2-column table for signature alignment (no borders)
-    sig_table = doc.add_table(rows=4, cols=2)
-    sig_table.alignment = WD_TABLE_ALIGNMENT.CENTER
-
-    # Remove borders from signature table
-    for row in sig_table.rows:
-        for cell in row.cells:
-            tc = cell._tc
-            tcPr = tc.get_or_add_tcPr()
-            tcBorders = tcPr.find(qn("w:tcBorders"))
-            if tcBorders is not None:
-                tcPr.remove(tcBorders)
-            # Add empty borders element to suppress
-            borders = tcPr.makeelement(qn("w:tcBorders"), {})
-            for edge in ("top", "left", "bottom", "right", "insideH", "insideV"):
-                border = borders.makeelement(qn(f"w:{edge}"), {
-                    qn("w:val"): "none",
-                    qn("w:sz"): "0",
-                    qn("w:space"): "0",
-                    qn("w:color"): "auto",
-                })
-                borders.append(border)
-            tcPr.append(borders)
-
-    # Row 0: Labels
-    _set_cell_text(sig_table.rows[0].cells[0], "Korisnik usluga")
-    _set_cell_text(sig_table.rows[0].cells[1], "Izvršitelj usluga")
-
-    # Row 1: Company names
-    _set_cell_text(sig_table.rows[1].cells[0], "{{ korisnik_naziv }}", bold=True)
-    _set_cell_text(sig_table.rows[1].cells[1], "{{ davatelj_naziv }}", bold=True)
-
-    # Row 2: Signature lines
-    _set_cell_text(sig_table.rows[2].cells[0], "_________________")
-    _set_cell_text(sig_table.rows[2].cells[1], "_________________")
-
-    # Row 3: Director names + role
-    _set_cell_text(sig_table.rows[3].cells[0], "{{ korisnik_direktor }}\nDirektor")
-    _set_cell_text(sig_table.rows[3].cells[1], "{{ davatelj_direktor }}\nDirektor")
-
-    # MP. (stamp) line
-    _add_para(doc, "")
-    sig2 = doc.add_table(rows=1, cols=2)
-    sig2.alignment = WD_TABLE_ALIGNMENT.CENTER
-    # Remove borders
-    for cell in sig2.rows[0].cells:
-        tc = cell._tc
-        tcPr = tc.get_or_add_tcPr()
-        borders = tcPr.makeelement(qn("w:tcBorders"), {})
-        for edge in ("top", "left", "bottom", "right", "insideH", "insideV"):
-            border = borders.makeelement(qn(f"w:{edge}"), {
-                qn("w:val"): "none",
-                qn("w:sz"): "0",
-                qn("w:space"): "0",
-                qn("w:color"): "auto",
-            })
-            borders.append(border)
-        tcPr.append(borders)
-    _set_cell_text(sig2.rows[0].cells[0], "MP.")
-    _set_cell_text(sig2.rows[0].cells[1], "MP.")
-
-    # ── Save ────────────────────────────────────────────────────────
+    _add_para(body, "U {{ mjesto }}, {{ datum_aneksa }}", space_after=2 * _GAP)
+
+    # 2-column table for signature alignment (no borders)
+    _add_table(
+        body,
+        [
+            [("Korisnik usluga", False), ("Izvršitelj usluga", False)],
+            [("{{ korisnik_naziv }}", True), ("{{ davatelj_naziv }}", True)],
+            [("_________________", False), ("_________________", False)],
+            [("{{ korisnik_direktor }}\nDirektor", False),
+             ("{{ davatelj_direktor }}\nDirektor", False)],
+        ],
+        borderless=True,
+    )
+
+    # MP. (stamp) line — the empty paragraph keeps Word from merging the two tables
+    _add_para(body, "")
+    _add_table(body, [[("MP.", False), ("MP.", False)]], borderless=True)
+
+    # ── Section (A4, 2cm margins) ───────────────────────────────────
+    body.append(
+        "<w:sectPr>"
+        f'<w:pgSz w:w="{_PAGE_WIDTH}" w:h="{_PAGE_HEIGHT}"/>'
+        f'<w:pgMar w:top="{_MARGIN}" w:right="{_MARGIN}" w:bottom="{_MARGIN}" '
+        f'w:left="{_MARGIN}" w:header="720" w:footer="720" w:gutter="0"/>'
+        "</w:sectPr>"
+    )
+
+    return (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        f'<w:document xmlns:w="{_W_NS}" xmlns:r="{_R_NS}">'
+        f"<w:body>{''.join(body)}</w:body></w:document>"
+    )
+
+
+DOCUMENT_XML_TEMPLATE = _document_xml().encode("utf-8")
+
+
+def build_template() -> Path:
+    """Create the annex .docx template with Jinja2 placeholders."""
     TEMPLATE_DIR.mkdir(parents=True, exist_ok=True)
-    doc.save(str(TEMPLATE_PATH))
+
+    with ZipFile(TEMPLATE_PATH, "w", ZIP_DEFLATED) as z:
+        z.writestr("[Content_Types].xml", _CONTENT_TYPES_XML)
+        z.writestr("_rels/.rels", _ROOT_RELS_XML)
+        z.writestr("word/_rels/document.xml.rels", _DOCUMENT_RELS_XML)
+        z.writestr("word/styles.xml", _STYLES_XML)
+        z.writestr("word/document.xml", DOCUMENT_XML_TEMPLATE)
+
     print(f"Template created: {TEMPLATE_PATH}")
     return TEMPLATE_PATH
 
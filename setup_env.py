@@ -8,10 +8,14 @@ Usage:
     python3 setup_env.py
 """
 
+from __future__ import annotations
+
 import os
+import shutil
 import subprocess
 import sys
 import venv
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 # Minimum Python version
@@ -20,6 +24,7 @@ MIN_PYTHON = (3, 9)
 # Project root = directory containing this script
 PROJECT_ROOT = Path(__file__).resolve().parent
 VENV_DIR = PROJECT_ROOT / ".venv"
+PIP_CACHE_DIR = PROJECT_ROOT / ".pip-cache"
 
 
 def print_header(msg: str) -> None:
@@ -82,18 +87,21 @@ def install_dependencies(python: Path) -> None:
     """Install project dependencies using pip."""
     print("  Instaliram ovisnosti / Installing dependencies ...")
 
-    # Upgrade pip first
-    subprocess.run(
-        [str(python), "-m", "pip", "install", "--upgrade", "pip"],
-        check=True,
-        capture_output=True,
-    )
-
-    # Install the project in editable mode (pulls all deps from pyproject.toml)
+    # One pip run upgrades pip and installs the project in editable mode
+    # (pulls all deps from pyproject.toml). Wheels are cached in the project so
+    # re-running setup does not download or rebuild them again.
+    env = os.environ.copy()
+    env.setdefault("PIP_CACHE_DIR", str(PIP_CACHE_DIR))
     result = subprocess.run(
-        [str(python), "-m", "pip", "install", "-e", str(PROJECT_ROOT)],
-        capture_output=True,
+        [
+            str(python), "-m", "pip", "install",
+            "--upgrade", "--prefer-binary", "--disable-pip-version-check",
+            "pip", "-e", str(PROJECT_ROOT),
+        ],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
         text=True,
+        env=env,
     )
 
     if result.returncode != 0:
@@ -104,6 +112,22 @@ def install_dependencies(python: Path) -> None:
     print_ok("Sve ovisnosti instalirane / All dependencies installed")
 
 
+def _probe_libreoffice(path: str) -> str | None:
+    """Run ``<path> --version``; return the version string or None on failure."""
+    try:
+        result = subprocess.run(
+            [path, "--version"],
+            capture_output=True,
+            text=True,
+            timeout=10,
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    if result.returncode != 0:
+        return None
+    return result.stdout.strip()
+
+
 def check_libreoffice() -> None:
     """Check if LibreOffice is available (needed for .doc conversion)."""
     lo_names = ["soffice", "libreoffice"]
@@ -115,22 +139,28 @@ def check_libreoffice() -> None:
             if prog:
                 lo_names.append(os.path.join(prog, "LibreOffice", "program", "soffice.exe"))
 
-    found = False
+    # Resolve candidates up front so only binaries that exist get executed;
+    # "soffice" and "libreoffice" often resolve to the same file.
+    candidates: list[str] = []
     for name in lo_names:
+        path = name if os.path.isabs(name) else shutil.which(name)
+        if path and os.path.isfile(path) and path not in candidates:
+            candidates.append(path)
+
+    found = False
+    if candidates:
+        # Probe concurrently — a cold LibreOffice start can take seconds
+        pool = ThreadPoolExecutor(max_workers=len(candidates))
+        futures = [pool.submit(_probe_libreoffice, path) for path in candidates]
         try:
-            result = subprocess.run(
-                [name, "--version"],
-                capture_output=True,
-                text=True,
-                timeout=10,
-            )
-            if result.returncode == 0:
-                ver = result.stdout.strip()
-                print_ok(f"LibreOffice: {ver}")
-                found = True
-                break
-        except (FileNotFoundError, subprocess.TimeoutExpired):
-            continue
+            for future in as_completed(futures):
+                ver = future.result()
+                if ver is not None:
+                    print_ok(f"LibreOffice: {ver}")
+                    found = True
+                    break
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
 
     if not found:
         print_warn(
@@ -151,8 +181,12 @@ def validate_imports(python: Path) -> None:
         "import doc_pipeline.phases.generation; "
         "print('OK')"
     )
+    # -I: skip PYTHON* env vars, the user site dir and the cwd on sys.path, so
+    # only the venv (and its editable install) is consulted. -S is not usable
+    # here: the venv's site-packages and the editable-install hook both come
+    # from site.py.
     result = subprocess.run(
-        [str(python), "-c", test_code],
+        [str(python), "-I", "-c", test_code],
         capture_output=True,
         text=True,
         cwd=str(PROJECT_ROOT),
@@ -188,7 +222,6 @@ def check_config() -> None:
     if config_path.exists():
         print_ok("Konfiguracija pronađena / Config found: pipeline.toml")
     elif template_path.exists():
-        import shutil
         shutil.copy2(template_path, config_path)
         print_ok(
             "pipeline.toml kreiran iz predloška — prilagodite vrijednosti"
@@ -204,10 +237,9 @@ def check_env() -> None:
     """Check if .env with API key exists."""
     env_path = PROJECT_ROOT / ".env"
     if env_path.exists():
-        content = env_path.read_text()
-        if "ANTHROPIC_API_KEY" in content:
-            # Check it's not a placeholder
-            for line in content.splitlines():
+        with env_path.open(encoding="utf-8") as fh:
+            for line in fh:
+                # Check it's not a placeholder
                 if line.startswith("ANTHROPIC_API_KEY=") and len(line.split("=", 1)[1].strip()) > 10:
                     print_ok("API ključ pronađen / API key found in .env")
                     return
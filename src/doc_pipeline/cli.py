@@ -2,26 +2,50 @@
 
 from __future__ import annotations
 
-import traceback
+import functools
+import os
+import re
 from pathlib import Path
 from typing import Annotated, Optional
 
 import typer
 
-from doc_pipeline.config import load_config
-from doc_pipeline.models import Inventory
-from doc_pipeline.utils.progress import (
-    console,
-    print_client_table,
-    print_flagged_clients,
-    print_inventory_summary,
-)
+# Config, models and the table printers pull in pydantic; they are imported
+# inside the commands that need them so `--version`/`--help` stay fast.
+from doc_pipeline.utils.progress import console
 
 __version__ = "1.0.0"
 
 # Module-level flag toggled by --verbose on the main callback.
 _verbose: bool = False
 
+# Rich style per phase status, used by `status`.
+_STATUS_COLORS: dict[str, str] = {
+    "completed": "green",
+    "running": "yellow",
+    "failed": "red",
+    "pending": "dim",
+}
+
+# Separator for --clients lists: the comma plus any whitespace around it.
+_CLIENTS_SPLIT = re.compile(r"\s*,\s*")
+
+
+def _parse_clients(clients: str | None) -> list[str] | None:
+    """Split a --clients value into names; None when the option was not given.
+
+    A value with no names in it (``","``, ``" "``) is rejected: an empty
+    filter would otherwise select every client.
+    """
+    if not clients:
+        return None
+    names = [c for c in _CLIENTS_SPLIT.split(clients.strip()) if c]
+    if not names:
+        raise typer.BadParameter(
+            "nijedno ime klijenta / no client names given", param_hint="'--clients'"
+        )
+    return names
+
 
 def _version_callback(value: bool) -> None:
     if value:
@@ -29,10 +53,55 @@ def _version_callback(value: bool) -> None:
         raise typer.Exit()
 
 
+def _handle_errors(fn):
+    """Turn errors in a phase command into a short bilingual message + exit code.
+
+    Ctrl+C exits with 130, any other exception with 1 (full traceback only
+    with --verbose); typer.Exit and usage errors pass through untouched.
+    """
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        try:
+            return fn(*args, **kwargs)
+        except (typer.Exit, typer.BadParameter):
+            raise
+        except KeyboardInterrupt:
+            console.print("\n[yellow]Prekinuto / Interrupted[/yellow]")
+            raise typer.Exit(130)
+        except Exception as e:
+            if _verbose:
+                import traceback
+
+                console.print(traceback.format_exc())
+            console.print(f"\n[red]Greska / Error: {e}[/red]")
+            console.print("[dim]Use --verbose for full traceback[/dim]")
+            raise typer.Exit(1)
+
+    return wrapper
+
+
+def _latest_run_dir(state_path: Path) -> Path | None:
+    """Most recent run directory under runs/ (names are timestamps), or None.
+
+    Directories only, so stray files in runs/ are skipped. ``scandir``
+    entries carry the file type from the directory listing, so this costs
+    no per-entry ``stat``.
+    """
+    with os.scandir(state_path) as it:
+        latest = max((e.name for e in it if e.is_dir()), default=None)
+    return state_path / latest if latest is not None else None
+
+
 app = typer.Typer(
     name="pipeline",
     help="Contract price adjustment pipeline for Croatian legal documents.",
     no_args_is_help=True,
+    # Startup trimming: phase commands report errors via _handle_errors, help
+    # text has no markup, and shell completion is not used.
+    pretty_exceptions_enable=False,
+    rich_markup_mode=None,
+    add_completion=False,
 )
 
 
@@ -58,6 +127,7 @@ def main(
 
 
 @app.command()
+@_handle_errors
 def setup(
     source: Annotated[
         Optional[Path],
@@ -77,26 +147,16 @@ def setup(
     ] = False,
 ) -> None:
     """Phase 0: Copy source contracts, scan, classify, and build inventory."""
-    try:
-        from doc_pipeline.phases.setup import run_setup
-
-        config = load_config()
-        source_path = source or config.source_path
-        run_setup(config, source=source_path, force=force, scan_only=scan_only, dry_run=dry_run)
-    except typer.Exit:
-        raise
-    except KeyboardInterrupt:
-        console.print("\n[yellow]Prekinuto / Interrupted[/yellow]")
-        raise typer.Exit(130)
-    except Exception as e:
-        if _verbose:
-            console.print(traceback.format_exc())
-        console.print(f"\n[red]Greska / Error: {e}[/red]")
-        console.print("[dim]Use --verbose for full traceback[/dim]")
-        raise typer.Exit(1)
+    from doc_pipeline.config import load_config
+    from doc_pipeline.phases.setup import run_setup
+
+    config = load_config()
+    source_path = source or config.source_path
+    run_setup(config, source=source_path, force=force, scan_only=scan_only, dry_run=dry_run)
 
 
 @app.command()
+@_handle_errors
 def extract(
     force: Annotated[
         bool,
@@ -108,7 +168,7 @@ def extract(
     ] = None,
     sync: Annotated[
         bool,
-        typer.Option("--sync", help="Use sync API instead of batch (one at a time)."),
+        typer.Option("--sync", help="Use the regular API instead of batch (a few requests in parallel)."),
     ] = False,
     skip_conversion: Annotated[
         bool,
@@ -120,47 +180,38 @@ def extract(
     ] = False,
 ) -> None:
     """Phase 1: Parse documents, extract pricing via Claude API, generate spreadsheet."""
-    try:
-        from doc_pipeline.phases.extraction import run_extraction
+    from doc_pipeline.config import load_config
+    from doc_pipeline.phases.extraction import run_extraction
 
-        config = load_config()
-
-        # Prerequisite checks
-        if not config.inventory_path.exists():
-            console.print("[red]Inventar nije pronaden. Pokrenite 'pipeline setup' prvo.[/red]")
-            console.print("[red]No inventory found. Run 'pipeline setup' first.[/red]")
-            raise typer.Exit(1)
+    client_names = _parse_clients(clients)
+    config = load_config()
 
-        if not config.data_source_path.exists():
-            console.print("[red]Radna kopija nije pronadena. Pokrenite 'pipeline setup' prvo.[/red]")
-            console.print("[red]Working copy (data/source/) not found. Run 'pipeline setup' first.[/red]")
-            raise typer.Exit(1)
+    # Prerequisite checks
+    if not config.inventory_path.exists():
+        console.print("[red]Inventar nije pronaden. Pokrenite 'pipeline setup' prvo.[/red]")
+        console.print("[red]No inventory found. Run 'pipeline setup' first.[/red]")
+        raise typer.Exit(1)
 
-        client_names = [c.strip() for c in clients.split(",")] if clients else None
-        run_extraction(
-            config,
-            force=force,
-            client_names=client_names,
-            sync_mode=sync,
-            skip_conversion=skip_conversion,
-            spreadsheet_only=spreadsheet_only,
-        )
-    except typer.Exit:
-        raise
-    except KeyboardInterrupt:
-        console.print("\n[yellow]Prekinuto / Interrupted[/yellow]")
-        raise typer.Exit(130)
-    except Exception as e:
-        if _verbose:
-            console.print(traceback.format_exc())
-        console.print(f"\n[red]Greska / Error: {e}[/red]")
-        console.print("[dim]Use --verbose for full traceback[/dim]")
+    if not config.data_source_path.exists():
+        console.print("[red]Radna kopija nije pronadena. Pokrenite 'pipeline setup' prvo.[/red]")
+        console.print("[red]Working copy (data/source/) not found. Run 'pipeline setup' first.[/red]")
         raise typer.Exit(1)
 
+    run_extraction(
+        config,
+        force=force,
+        client_names=client_names,
+        sync_mode=sync,
+        skip_conversion=skip_conversion,
+        spreadsheet_only=spreadsheet_only,
+    )
+
 
 @app.command()
 def status() -> None:
     """Show current pipeline state."""
+    from doc_pipeline.config import load_config
+
     config = load_config()
     state_path = config.project_root / "runs"
 
@@ -168,48 +219,47 @@ def status() -> None:
         console.print("[yellow]No runs found. Run 'pipeline setup' first.[/yellow]")
         raise typer.Exit()
 
-    # Find most recent run (filter to directories only to skip stray files)
-    run_dirs = sorted(
-        [d for d in state_path.iterdir() if d.is_dir()],
-        reverse=True,
-    )
-    if not run_dirs:
+    latest_dir = _latest_run_dir(state_path)
+    if latest_dir is None:
         console.print("[yellow]No runs found.[/yellow]")
         raise typer.Exit()
 
+    from concurrent.futures import ThreadPoolExecutor
+
+    from doc_pipeline.models import Inventory
     from doc_pipeline.state import RunState
 
-    latest_dir = run_dirs[0]
     state_file = latest_dir / "state.json"
     if not state_file.exists():
         console.print(f"[yellow]No state.json in {latest_dir}[/yellow]")
         raise typer.Exit()
 
-    state = RunState.load(state_file)
+    # State and inventory are independent files — read them concurrently
+    inv_path = config.inventory_path
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        state_future = pool.submit(RunState.load, state_file)
+        inv_future = pool.submit(Inventory.load_trusted, inv_path) if inv_path.exists() else None
+        state = state_future.result()
+        inv = inv_future.result() if inv_future else None
+
     console.print(f"\n[bold]Pipeline Status[/bold] (run: {state.run_id})")
     console.print(f"  Created: {state.created_at:%Y-%m-%d %H:%M}")
 
     for phase_name, phase in state.phases.items():
-        status_color = {
-            "completed": "green",
-            "running": "yellow",
-            "failed": "red",
-            "pending": "dim",
-        }.get(phase.status, "")
-
-        console.print(f"  {phase_name}: [{status_color}]{phase.status}[/{status_color}]", end="")
+        status_color = _STATUS_COLORS.get(phase.status, "")
+
+        # One print per phase: Rich parses the markup and writes the line once
+        parts = [f"  {phase_name}: [{status_color}]{phase.status}[/{status_color}]"]
         if phase.started_at:
-            console.print(f" (started {phase.started_at:%H:%M})", end="")
+            parts.append(f" (started {phase.started_at:%H:%M})")
         if phase.completed_at:
-            console.print(f" → {phase.completed_at:%H:%M}", end="")
+            parts.append(f" → {phase.completed_at:%H:%M}")
         if phase.error:
-            console.print(f" [red]Error: {phase.error}[/red]", end="")
-        console.print()
+            parts.append(f" [red]Error: {phase.error}[/red]")
+        console.print("".join(parts))
 
     # Show inventory summary if available
-    inv_path = config.inventory_path
-    if inv_path.exists():
-        inv = Inventory.load(inv_path)
+    if inv is not None:
         console.print(f"\n  Inventory: {inv.total_clients} clients, "
                       f"{inv.clients_with_contracts} with contracts, "
                       f"{inv.clients_with_annexes} with annexes")
@@ -231,6 +281,14 @@ def inventory(
     ] = None,
 ) -> None:
     """Print file inventory summary."""
+    from doc_pipeline.config import load_config
+    from doc_pipeline.models import Inventory
+    from doc_pipeline.utils.progress import (
+        print_client_table,
+        print_flagged_clients,
+        print_inventory_summary,
+    )
+
     config = load_config()
     inv_path = config.inventory_path
 
@@ -238,15 +296,16 @@ def inventory(
         console.print("[yellow]No inventory found. Run 'pipeline setup' first.[/yellow]")
         raise typer.Exit(1)
 
-    inv = Inventory.load(inv_path)
+    inv = Inventory.load_trusted(inv_path)
 
     if fmt == "json":
-        import json
-        if flagged_only:
-            data = [c.model_dump() for c in inv.flagged_clients]
-        else:
-            data = [c.model_dump() for c in inv.clients]
-        console.print_json(json.dumps(data, default=str, ensure_ascii=False))
+        from pydantic import TypeAdapter
+
+        from doc_pipeline.models import ClientEntry
+
+        # Serialize straight to JSON in pydantic-core (no intermediate dicts)
+        selected = inv.flagged_clients if flagged_only else inv.clients
+        console.print_json(TypeAdapter(list[ClientEntry]).dump_json(selected).decode("utf-8"))
         return
 
     # Table format
@@ -259,14 +318,12 @@ def inventory(
     else:
         clients = inv.clients
         if doc_type:
-            clients = [
-                c for c in clients
-                if any(f.doc_type.value == doc_type for f in c.selected_files)
-            ]
+            clients = [c for c in clients if doc_type in c.doc_types]
         print_client_table(clients, title=f"All Clients ({len(clients)})")
 
 
 @app.command()
+@_handle_errors
 def generate(
     start_number: Annotated[
         Optional[int],
@@ -289,44 +346,79 @@ def generate(
     ] = False,
 ) -> None:
     """Phase 3: Generate annex documents from approved spreadsheet rows."""
-    try:
-        from doc_pipeline.phases.generation import run_generation
-
-        config = load_config()
-
-        # Prompt for start number if not provided
-        if start_number is None:
-            start_number_str = console.input(
-                "[bold]Enter starting annex sequence number "
-                "(empty = auto-detect, e.g., 30 for U-26-30): [/bold]"
-            )
-            raw = start_number_str.strip()
-            if raw:
-                try:
-                    start_number = int(raw)
-                except ValueError:
-                    console.print("[red]Invalid number.[/red]")
-                    raise typer.Exit(1)
-
-        client_names = [c.strip() for c in clients.split(",")] if clients else None
-        run_generation(
-            config,
-            start_number=start_number,
-            client_names=client_names,
-            dry_run=dry_run,
-            force=force,
+    from doc_pipeline.config import load_config
+    from doc_pipeline.phases.generation import run_generation
+
+    client_names = _parse_clients(clients)
+    config = load_config()
+
+    # Prompt for start number if not provided
+    if start_number is None:
+        start_number_str = console.input(
+            "[bold]Enter starting annex sequence number "
+            "(empty = auto-detect, e.g., 30 for U-26-30): [/bold]"
         )
-    except typer.Exit:
-        raise
-    except KeyboardInterrupt:
-        console.print("\n[yellow]Prekinuto / Interrupted[/yellow]")
-        raise typer.Exit(130)
-    except Exception as e:
-        if _verbose:
-            console.print(traceback.format_exc())
-        console.print(f"\n[red]Greska / Error: {e}[/red]")
-        console.print("[dim]Use --verbose for full traceback[/dim]")
-        raise typer.Exit(1)
+        raw = start_number_str.strip()
+        if raw:
+            try:
+                start_number = int(raw)
+            except ValueError:
+                console.print("[red]Invalid number.[/red]")
+                raise typer.Exit(1)
+
+    run_generation(
+        config,
+        start_number=start_number,
+        client_names=client_names,
+        dry_run=dry_run,
+        force=force,
+    )
+
+
+@app.command(name="all")
+@_handle_errors
+def run_all(
+    source: Annotated[
+        Optional[Path],
+        typer.Option("--source", "-s", help="Source contracts folder path."),
+    ] = None,
+    force: Annotated[
+        bool,
+        typer.Option("--force", "-f", help="Overwrite existing working copy."),
+    ] = False,
+    scan_only: Annotated[
+        bool,
+        typer.Option("--scan-only", help="Skip copy, re-scan existing data/source/."),
+    ] = False,
+    sync: Annotated[
+        bool,
+        typer.Option("--sync", help="Use the regular API instead of batch (a few requests in parallel)."),
+    ] = False,
+) -> None:
+    """Run setup and extract in one process, up to the manual review step.
+
+    Config and imports are loaded once. Generation is left out: it needs the
+    rows approved in the spreadsheet first, so run 'pipeline generate' after
+    the review.
+    """
+    from doc_pipeline.config import load_config
+    from doc_pipeline.phases.extraction import run_extraction
+    from doc_pipeline.phases.setup import run_setup
+
+    config = load_config()
+    run_setup(
+        config, source=source or config.source_path, force=force, scan_only=scan_only
+    )
+    run_extraction(config, sync_mode=sync)
+
+    console.print(
+        f"\n[bold]Pregledajte i odobrite redove u {config.spreadsheet_path}, "
+        "zatim pokrenite 'pipeline generate'.[/bold]"
+    )
+    console.print(
+        f"[bold]Review and approve rows in {config.spreadsheet_path}, "
+        "then run 'pipeline generate'.[/bold]"
+    )
 
 
 @app.command()
@@ -341,6 +433,7 @@ def reset(
     ] = False,
 ) -> None:
     """Reset pipeline state to allow re-running phases."""
+    from doc_pipeline.config import load_config
     from doc_pipeline.state import RunState
 
     config = load_config()
@@ -350,16 +443,11 @@ def reset(
         console.print("[yellow]Nema stanja pipeline-a. / No pipeline state found.[/yellow]")
         raise typer.Exit(0)
 
-    # Find the most recent run directory (same pattern as `status`)
-    run_dirs = sorted(
-        [d for d in state_path.iterdir() if d.is_dir()],
-        reverse=True,
-    )
-    if not run_dirs:
+    latest_dir = _latest_run_dir(state_path)
+    if latest_dir is None:
         console.print("[yellow]Nema stanja pipeline-a. / No pipeline state found.[/yellow]")
         raise typer.Exit(0)
 
-    latest_dir = run_dirs[0]
     state_file = latest_dir / "state.json"
     if not state_file.exists():
         console.print(f"[yellow]No state.json in {latest_dir}[/yellow]")
@@ -394,14 +482,20 @@ def reset(
 
 
 @app.command(name="validate-template")
-def validate_template() -> None:
+def validate_template(
+    strict: Annotated[
+        bool,
+        typer.Option("--strict", help="Parse the template with Jinja2 instead of a quick text scan"),
+    ] = False,
+) -> None:
     """Check template has all required Jinja2 placeholders."""
+    from doc_pipeline.config import load_config
     from doc_pipeline.phases.generation import validate_template as _validate
 
     config = load_config()
     console.print(f"[bold]Validating template:[/bold] {config.template_path}")
 
-    is_valid, issues = _validate(config.template_path)
+    is_valid, issues = _validate(config.template_path, strict=strict)
 
     for issue in issues:
         if issue.startswith("Missing"):
@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
+import functools
 import logging
 import os
+import re
 from datetime import date
+from functools import cached_property
 from pathlib import Path
-from typing import Optional
+from typing import Literal, Optional
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field
 
 try:
     import tomllib
@@ -17,7 +20,19 @@ except ModuleNotFoundError:
 
 logger = logging.getLogger(__name__)
 
-_PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+
+@functools.cache
+def _project_root() -> Path:
+    """Repository root (resolved on first use, not at import)."""
+    return Path(__file__).resolve().parent.parent.parent
+
+
+# ANTHROPIC_API_KEY=value in .env; surrounding quotes (common in .env files)
+# are stripped by the first two alternatives
+_ENV_API_KEY_RE = re.compile(
+    r"""^[ \t]*ANTHROPIC_API_KEY[ \t]*=[ \t]*(?:"([^"\n]*)"|'([^'\n]*)'|(.*?))[ \t]*$""",
+    re.MULTILINE,
+)
 
 
 class GeneralConfig(BaseModel):
@@ -38,15 +53,7 @@ class PathsConfig(BaseModel):
 class ExtractionConfig(BaseModel):
     model: str = "claude-sonnet-4-6-20250514"
     use_batch_api: bool = True
-    confidence_threshold: str = "medium"
-
-    @field_validator('confidence_threshold', mode='before')
-    @classmethod
-    def validate_confidence(cls, v):
-        valid = {"low", "medium", "high"}
-        if v not in valid:
-            raise ValueError(f"confidence_threshold must be one of {valid}, got '{v}'")
-        return v
+    confidence_threshold: Literal["low", "medium", "high"] = "medium"
 
 
 class CurrencyConfig(BaseModel):
@@ -55,23 +62,17 @@ class CurrencyConfig(BaseModel):
 
 
 class GenerationConfig(BaseModel):
-    default_effective_date: str = "2026-03-01"
+    default_effective_date: date = date(2026, 3, 1)  # YYYY-MM-DD in pipeline.toml
     vat_note: str = "Sve cijene su izražene bez PDV-a."
 
-    @field_validator('default_effective_date', mode='before')
-    @classmethod
-    def validate_date(cls, v):
-        if isinstance(v, str):
-            try:
-                date.fromisoformat(v)
-            except ValueError:
-                raise ValueError(f"default_effective_date must be YYYY-MM-DD format, got '{v}'")
-        return v
-
 
 class PipelineConfig(BaseModel):
     """Top-level configuration assembled from pipeline.toml + .env."""
 
+    # Derived paths are computed once per instance; configs are not mutated
+    # after load_config() builds them.
+    model_config = ConfigDict(ignored_types=(cached_property,))
+
     general: GeneralConfig = Field(default_factory=GeneralConfig)
     paths: PathsConfig = Field(default_factory=PathsConfig)
     extraction: ExtractionConfig = Field(default_factory=ExtractionConfig)
@@ -81,45 +82,45 @@ class PipelineConfig(BaseModel):
 
     @property
     def project_root(self) -> Path:
-        return _PROJECT_ROOT
+        return _project_root()
 
-    @property
+    @cached_property
     def source_path(self) -> Path:
         return self._resolve(self.paths.source)
 
-    @property
+    @cached_property
     def working_path(self) -> Path:
         return self._resolve(self.paths.working_dir)
 
-    @property
+    @cached_property
     def data_source_path(self) -> Path:
         return self.working_path / "source"
 
-    @property
+    @cached_property
     def output_path(self) -> Path:
         return self._resolve(self.paths.output_dir)
 
-    @property
+    @cached_property
     def inventory_path(self) -> Path:
         return self.working_path / "inventory.json"
 
-    @property
+    @cached_property
     def converted_path(self) -> Path:
         return self.working_path / "converted"
 
-    @property
+    @cached_property
     def extractions_path(self) -> Path:
         return self.working_path / "extractions"
 
-    @property
+    @cached_property
     def spreadsheet_path(self) -> Path:
         return self.output_path / "control_spreadsheet.xlsx"
 
-    @property
+    @cached_property
     def annexes_output_path(self) -> Path:
         return self.output_path / "annexes"
 
-    @property
+    @cached_property
     def template_path(self) -> Path:
         return self._resolve(self.paths.template)
 
@@ -142,14 +143,38 @@ class PipelineConfig(BaseModel):
         return self.project_root / path
 
 
+def _mtime_ns(path: Path) -> int:
+    """Modification time of *path* in ns, or -1 if it does not exist."""
+    try:
+        return path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return -1
+
+
 def load_config() -> PipelineConfig:
-    """Load configuration from pipeline.toml and .env."""
-    toml_path = _PROJECT_ROOT / "pipeline.toml"
-    env_path = _PROJECT_ROOT / ".env"
+    """Load configuration from pipeline.toml and .env.
+
+    The parsed config is reused until either file changes on disk (or the
+    ANTHROPIC_API_KEY environment variable does), so callers share one
+    instance and must treat it as read-only.
+    """
+    root = _project_root()
+    return _load_config_cached(
+        _mtime_ns(root / "pipeline.toml"),
+        _mtime_ns(root / ".env"),
+        os.environ.get("ANTHROPIC_API_KEY", ""),
+    )
+
+
+@functools.lru_cache(maxsize=4)
+def _load_config_cached(toml_mtime: int, env_mtime: int, env_api_key: str) -> PipelineConfig:
+    """Parse pipeline.toml + .env; cache key is (mtimes, env var)."""
+    toml_path = _project_root() / "pipeline.toml"
+    env_path = _project_root() / ".env"
 
     # Load TOML
     data: dict = {}
-    if toml_path.exists():
+    if toml_mtime >= 0:
         with open(toml_path, "rb") as f:
             data = tomllib.load(f)
         logger.debug("Loaded config from %s", toml_path)
@@ -157,21 +182,11 @@ def load_config() -> PipelineConfig:
         logger.warning("Config file not found: %s, using defaults", toml_path)
 
     # Load .env for API key
-    api_key = os.environ.get("ANTHROPIC_API_KEY", "")
-    if not api_key and env_path.exists():
-        for line in env_path.read_text().splitlines():
-            line = line.strip()
-            if line.startswith("#") or "=" not in line:
-                continue
-            key, _, val = line.partition("=")
-            if key.strip() == "ANTHROPIC_API_KEY":
-                val = val.strip()
-                # Strip surrounding quotes (common in .env files)
-                if (val.startswith('"') and val.endswith('"')) or \
-                   (val.startswith("'") and val.endswith("'")):
-                    val = val[1:-1]
-                api_key = val
-                break
+    api_key = env_api_key
+    if not api_key and env_mtime >= 0:
+        match = _ENV_API_KEY_RE.search(env_path.read_text())
+        if match:
+            api_key = next(g for g in match.groups() if g is not None)
 
     data["anthropic_api_key"] = api_key
     return PipelineConfig.model_validate(data)
@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
-import json
+import array
+import bisect
+import functools
+import importlib
+import itertools
 import logging
 import os
 import platform
@@ -11,30 +15,47 @@ import re
 import subprocess
 import sys
 import threading
+import time
 import tkinter as tk
-from datetime import datetime
-from io import StringIO
+import weakref
+from collections import OrderedDict, deque
 from pathlib import Path
 from tkinter import filedialog, messagebox, ttk
 from typing import Any
 
+import orjson
+from rich.console import Console
+
+from doc_pipeline.config import load_config
+from doc_pipeline.utils import progress as _progress
+
 # Project root — same logic as config.py
 _PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
 
+# Window icon (L3), checked once at import
+_ICON_PATH = _PROJECT_ROOT / "assets" / "icon.png"
+_ICON_EXISTS = _ICON_PATH.exists()
+
 
 # ── Redirect Rich console output to a string buffer ─────────────────────────
 
 # Keywords that indicate safe auto-confirm prompts
 _SAFE_PROMPTS = {"continue", "proceed", "y/n", "da/ne"}
+# One case-insensitive scan for any of them (substring match, as before)
+_SAFE_RE = re.compile("|".join(map(re.escape, sorted(_SAFE_PROMPTS))), re.IGNORECASE)
 
 
 class _BufferedConsole:
-    """Captures Rich console output into a StringIO for GUI display."""
+    """Captures Rich console output into a deque of chunks for GUI display."""
 
-    def __init__(self) -> None:
-        self._buffer = StringIO()
+    def __init__(self, waker: _Waker | None = None) -> None:
+        # Worker threads append, the Tk thread pops; deque.append/popleft are
+        # atomic, so no lock is needed on either side.
+        self._buffer: deque[str] = deque()
         self._original_console = None
-        self._lock = threading.Lock()
+        self._waker = waker
+        # Built on first install() and reused for every later run
+        self._console: Console | None = None
 
     def install(self) -> None:
         """Replace the global Rich console with one that writes to our buffer.
@@ -43,25 +64,27 @@ class _BufferedConsole:
         GUI handles all user confirmations via its own dialogs before launching
         tasks.  Unknown prompts default to 'n' for safety.
         """
-        from rich.console import Console
-        from doc_pipeline.utils import progress
-
-        self._original_console = progress.console
+        self._original_console = _progress.console
+        if self._console is None:
+            self._console = self._make_console()
+        _progress.console = self._console
 
-        # Thread-safe write wrapper around the StringIO buffer
-        lock = self._lock
+    def _make_console(self) -> Console:
+        # Thread-safe write wrapper around the chunk deque
         raw_buffer = self._buffer
+        waker = self._waker
 
-        class _LockedWriter:
-            """A file-like wrapper that acquires the lock on every write."""
+        class _DequeWriter:
+            """A file-like wrapper that appends every write to the deque."""
 
             def write(self, s: str) -> int:
-                with lock:
-                    return raw_buffer.write(s)
+                raw_buffer.append(s)
+                if waker is not None:
+                    waker.wake()
+                return len(s)
 
             def flush(self) -> None:
-                with lock:
-                    raw_buffer.flush()
+                pass
 
             # Rich console checks for these
             @property
@@ -72,10 +95,10 @@ class _BufferedConsole:
                 return False
 
             def fileno(self) -> int:
-                raise OSError("_LockedWriter has no fileno")
+                raise OSError("_DequeWriter has no fileno")
 
         console = Console(
-            file=_LockedWriter(),  # type: ignore[arg-type]
+            file=_DequeWriter(),  # type: ignore[arg-type]
             force_terminal=False,
             no_color=True,
             width=120,
@@ -83,28 +106,130 @@ class _BufferedConsole:
 
         # Safe auto-confirm — only auto-yes for known safe prompts
         def _safe_auto_confirm(prompt: str = "") -> str:
-            prompt_lower = prompt.lower()
-            if any(kw in prompt_lower for kw in _SAFE_PROMPTS):
+            if _SAFE_RE.search(prompt):
                 return "y"
             logging.warning(f"GUI auto-confirm blocked unexpected prompt: {prompt}")
             return "n"
 
         console.input = _safe_auto_confirm  # type: ignore[assignment]
-        progress.console = console
+        return console
 
     def restore(self) -> None:
         if self._original_console is not None:
-            from doc_pipeline.utils import progress
-            progress.console = self._original_console
+            _progress.console = self._original_console
+
+    def read_new(self, max_chars: int | None = None) -> str:
+        """Read new output since last call, stopping once ``max_chars`` is reached."""
+        chunks = []
+        size = 0
+        popleft = self._buffer.popleft
+        try:
+            while max_chars is None or size < max_chars:
+                chunk = popleft()
+                chunks.append(chunk)
+                size += len(chunk)
+        except IndexError:
+            pass
+        return "".join(chunks)
+
+    def has_pending(self) -> bool:
+        return bool(self._buffer)
+
 
-    def read_new(self) -> str:
-        """Read any new output since last call."""
-        with self._lock:
-            val = self._buffer.getvalue()
-            if val:
-                self._buffer.truncate(0)
-                self._buffer.seek(0)
-            return val
+class _Waker:
+    """Wakes the Tk mainloop from worker threads through a self-pipe.
+
+    Tk watches the read end with createfilehandler, so the GUI reacts as soon
+    as a worker produces output instead of on the next polling tick. Not
+    available on Windows (no createfilehandler) — see :meth:`create`.
+    """
+
+    def __init__(self, root: tk.Tk, callback: Any) -> None:
+        self._root = root
+        self._callback = callback
+        self._r, self._w = os.pipe()
+        os.set_blocking(self._r, False)
+        os.set_blocking(self._w, False)
+        # True while a wakeup byte is in flight; avoids a write per Rich call
+        self._pending = False
+        root.tk.createfilehandler(self._r, tk.READABLE, self._on_readable)
+
+    @classmethod
+    def create(cls, root: tk.Tk, callback: Any) -> _Waker | None:
+        if not hasattr(root.tk, "createfilehandler"):
+            return None
+        return cls(root, callback)
+
+    def wake(self) -> None:
+        """Called from any thread."""
+        if self._pending:
+            return
+        self._pending = True
+        try:
+            os.write(self._w, b"\x01")
+        except (BlockingIOError, OSError):
+            pass  # pipe full (a wakeup is queued anyway) or already closed
+
+    def _on_readable(self, fd: int, mask: int) -> None:
+        # Drain before clearing the flag: a wake() that lands after the clear
+        # writes a fresh byte, and one that lands before it (flag still set)
+        # is covered by the callback below, which runs after both.
+        try:
+            while os.read(fd, 4096):
+                pass
+        except BlockingIOError:
+            pass
+        self._pending = False
+        self._callback()
+
+    def close(self) -> None:
+        # Workers may still call wake(): leave the write end open so a reused
+        # fd number is never written to, and stop further writes via the flag.
+        self._pending = True
+        self._root.tk.deletefilehandler(self._r)
+        os.close(self._r)
+
+
+class _WakingQueue(queue.Queue):
+    """Message queue that wakes the Tk mainloop on every put."""
+
+    def __init__(self, waker: _Waker | None) -> None:
+        super().__init__()
+        self._waker = waker
+
+    def put(self, item: Any, block: bool = True, timeout: float | None = None) -> None:
+        super().put(item, block, timeout)
+        if self._waker is not None:
+            self._waker.wake()
+
+
+class _TaskRunner:
+    """Runs pipeline tasks one after another on a single long-lived thread.
+
+    The thread is a daemon (ThreadPoolExecutor workers are joined at
+    interpreter exit), so the window can still be closed mid-phase.
+    """
+
+    def __init__(self) -> None:
+        self._tasks: queue.SimpleQueue[Any] = queue.SimpleQueue()
+        self._thread: threading.Thread | None = None
+
+    def submit(self, fn: Any) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, name="pipeline-worker", daemon=True
+            )
+            self._thread.start()
+        self._tasks.put(fn)
+
+    def _run(self) -> None:
+        while True:
+            fn = self._tasks.get()
+            try:
+                fn()
+            except Exception:
+                # Tasks report their own errors; keep the worker alive
+                logging.exception("Unhandled error in pipeline task")
 
 
 # ── Step definitions ─────────────────────────────────────────────────────────
@@ -129,23 +254,324 @@ _STEP_DEPS: dict[int, list[int]] = {
 # Maximum lines to keep in log area
 MAX_LOG_LINES = 3000
 
+# Lines copied from the Text widget per write when saving a log
+_SAVE_LOG_CHUNK_LINES = 500
+
+# Log polling: console text moved into the log per tick, and the delay before
+# the next tick while more is waiting (non-zero so Tk can redraw in between)
+_MAX_DRAIN_CHARS = 65536
+_DRAIN_BURST_MS = 10
+# Polling delay without a waker (Windows): short while output is flowing,
+# backing off while the task is quiet
+_POLL_BUSY_MS = 20
+_POLL_IDLE_MS = 150
+
+# How long a path existence check is trusted (see PipelineGUI._exists_cached)
+_EXISTS_TTL_S = 0.5
+
+# Review step: client previews kept in memory (least recently used dropped)
+_PREVIEW_CACHE_SIZE = 64
+
 # Platform detection for keyboard shortcuts
 _IS_MAC = platform.system() == "Darwin"
 _MOD = "Command" if _IS_MAC else "Control"
 _MOD_DISPLAY = "\u2318" if _IS_MAC else "Ctrl+"
 
+# Settings form validation (M31)
+_OIB_RE = re.compile(r"^\d{11}$")
+_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
+# Settings form layout: (section title, fields), each field being
+# (label, key, kind, fallback, tooltip). kind is "text", "masked" or
+# "folder"; fallback is shown when the config cannot be loaded.
+_SETTINGS_FORM = (
+    ("Putanje", (
+        ("Mapa s ugovorima:", "paths.source", "folder", "./contracts",
+         "Putanja do mape s ugovorima"),
+    )),
+    ("Podaci o tvrtki", (
+        ("Naziv tvrtke:", "general.company_name", "text", "", None),
+        ("OIB:", "general.company_oib", "text", "",
+         "OIB mora sadr\u017eavati to\u010dno 11 znamenki"),
+        ("Adresa:", "general.company_address", "text", "", None),
+        ("Direktor:", "general.company_director", "text", "", None),
+    )),
+    ("API / Ekstrakcija", (
+        ("Anthropic API klju\u010d:", "api_key", "masked", "",
+         "Anthropic API klju\u010d (po\u010dinje s 'sk-ant-')"),
+    )),
+    ("Generiranje", (
+        ("Datum stupanja na snagu (GGGG-MM-DD):", "generation.default_effective_date",
+         "text", "2026-03-01", "Format: GGGG-MM-DD (npr. 2026-03-01)"),
+    )),
+)
+
+# Inline banner colours and icon per level (see PipelineGUI._show_banner)
+_BANNER_COLORS = {
+    "success": {"bg": "#d4edda", "fg": "#155724", "border": "#28a745", "icon": "\u2713"},
+    "error":   {"bg": "#f8d7da", "fg": "#721c24", "border": "#dc3545", "icon": "\u2717"},
+    "warning": {"bg": "#fff3cd", "fg": "#856404", "border": "#ffc107", "icon": "\u26a0"},
+    "info":    {"bg": "#d1ecf1", "fg": "#0c5460", "border": "#17a2b8", "icon": "\u2139"},
+}
+_BANNER_FONT = ("Arial", 10)
+_BANNER_CLOSE_FONT = ("Arial", 10, "bold")
+# Lifetime of auto-dismissed banners, in seconds
+_BANNER_DISMISS_S = 5.0
+
+# Minimum time between status bar updates
+_STATUS_INTERVAL_MS = 100
+
+# Monospace font for log and preview areas
+_FIXED_FONT = ("Consolas" if sys.platform == "win32" else "Menlo", 10)
+
+# ttk themes to use, first available wins. clam renders custom button colors
+# on macOS; aqua ignores bg/fg, making styled buttons invisible.
+_PREFERRED_THEMES = ("clam", "alt", "default")
+
+# Set by _configure_styles() once the ttk styles are defined
+_STYLE_CONFIGURED = False
+
+
+def _configure_styles() -> None:
+    """Pick the ttk theme and define the app's styles.
+
+    ttk styles are global to the Tk interpreter, so this runs once per process
+    (the GUI creates a single Tk root).
+    """
+    global _STYLE_CONFIGURED
+    if _STYLE_CONFIGURED:
+        return
+
+    style = ttk.Style()
+    available = set(style.theme_names())
+    for preferred in _PREFERRED_THEMES:
+        if preferred in available:
+            style.theme_use(preferred)
+            break
+
+    # ── Button styles (color-coded hierarchy) ──
+    style.configure(
+        "Primary.TButton",
+        background="#2980b9",
+        foreground="white",
+        font=("Arial", 11, "bold"),
+        padding=(16, 8),
+    )
+    style.map(
+        "Primary.TButton",
+        background=[("active", "#2471a3"), ("pressed", "#1a5276"), ("disabled", "#85929e")],
+        foreground=[("disabled", "#bdc3c7")],
+    )
+
+    style.configure(
+        "Secondary.TButton",
+        background="#ecf0f1",
+        foreground="#2c3e50",
+        font=("Arial", 10),
+        padding=(12, 6),
+    )
+    style.map(
+        "Secondary.TButton",
+        background=[("active", "#d5dbdb"), ("pressed", "#bdc3c7"), ("disabled", "#f0f0f0")],
+        foreground=[("disabled", "#bdc3c7")],
+    )
+
+    style.configure(
+        "Danger.TButton",
+        background="#e74c3c",
+        foreground="white",
+        font=("Arial", 10),
+        padding=(12, 6),
+    )
+    style.map(
+        "Danger.TButton",
+        background=[("active", "#cb4335"), ("pressed", "#a93226"), ("disabled", "#85929e")],
+        foreground=[("disabled", "#bdc3c7")],
+    )
+
+    style.configure(
+        "Success.TButton",
+        background="#27ae60",
+        foreground="white",
+        font=("Arial", 11, "bold"),
+        padding=(16, 8),
+    )
+    style.map(
+        "Success.TButton",
+        background=[("active", "#229954"), ("pressed", "#1e8449"), ("disabled", "#85929e")],
+        foreground=[("disabled", "#bdc3c7")],
+    )
+
+    style.configure(
+        "LogToggle.TButton",
+        font=("Arial", 9, "bold"),
+        padding=(8, 2),
+    )
+
+    # Configure custom styles
+    style.configure("Sidebar.TFrame", background="#2c3e50")
+    style.configure(
+        "SidebarStep.TLabel",
+        background="#2c3e50",
+        foreground="#95a5a6",
+        font=("Arial", 11),
+        padding=(12, 8),
+    )
+    style.configure(
+        "SidebarStepActive.TLabel",
+        background="#34495e",
+        foreground="#ecf0f1",
+        font=("Arial", 11, "bold"),
+        padding=(12, 8),
+    )
+    style.configure(
+        "SidebarStepDone.TLabel",
+        background="#2c3e50",
+        foreground="#2ecc71",
+        font=("Arial", 11),
+        padding=(12, 8),
+    )
+    style.configure(
+        "SidebarStepLocked.TLabel",
+        background="#2c3e50",
+        foreground="#4a5568",
+        font=("Arial", 11),
+        padding=(12, 8),
+    )
+    style.configure("Status.TLabel", font=("Arial", 10), padding=(8, 4))
+    style.configure("Title.TLabel", font=("Arial", 14, "bold"))
+    style.configure("Subtitle.TLabel", font=("Arial", 10), foreground="#7f8c8d")
+
+    _STYLE_CONFIGURED = True
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    """Write via a temp file + os.replace, so readers never see a partial file."""
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(str(tmp), str(path))
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_client_filter(raw: str) -> tuple[str, ...]:
+    """Client names from a comma-separated filter field (F1), parsed once per value."""
+    return tuple(name for name in (c.strip() for c in raw.split(",")) if name)
+
+
+def _extracted_client_names(extractions_dir: Path) -> list[str]:
+    """Sorted client names that have an extraction JSON; [] if the folder is missing.
+
+    The listing is reused until the folder's modification time changes
+    (adding, removing or replacing a file updates it).
+    """
+    try:
+        mtime_ns = os.stat(extractions_dir).st_mtime_ns
+        return list(_list_extractions(str(extractions_dir), mtime_ns))
+    except FileNotFoundError:
+        return []
+
+
+@functools.lru_cache(maxsize=4)
+def _list_extractions(extractions_dir: str, mtime_ns: int) -> tuple[str, ...]:
+    """Scan *extractions_dir*; cache key is (path, mtime)."""
+    with os.scandir(extractions_dir) as it:
+        # is_file() comes from the directory entry itself (no extra stat on
+        # Linux/Windows) and skips stray sub-folders named *.json
+        return tuple(
+            sorted(e.name[:-5] for e in it if e.name.endswith(".json") and e.is_file())
+        )
+
+
+def _settings_value(cfg: Any, key: str) -> str:
+    """Current value of a settings form field ("section.name" or "api_key")."""
+    if key == "api_key":
+        return cfg.anthropic_api_key
+    section, name = key.split(".")
+    value = getattr(getattr(cfg, section), name)
+    return value.isoformat() if hasattr(value, "isoformat") else str(value)
+
+
+def _is_alive(widget: Any) -> bool:
+    """True if *widget* has been built and Tk has not destroyed it.
+
+    Asks Tk, so widgets destroyed outside Python (e.g. a toplevel closed by
+    the window manager) count as gone too.
+    """
+    if widget is None:
+        return False
+    try:
+        return bool(widget.winfo_exists())
+    except tk.TclError:
+        return False  # its Tk root is gone
+
+
+def _text_index(line_starts: list[int], offset: int) -> str:
+    """Tk "line.col" index of a character offset, given each line's start offset."""
+    line = bisect.bisect_right(line_starts, offset) - 1
+    return f"{line + 1}.{offset - line_starts[line]}"
+
+
+# Slow-to-import modules loaded in a background thread once the window is up,
+# so the first action that needs them does not wait for the import
+_PREWARM_MODULES = (
+    "anthropic",
+    "doc_pipeline.phases.setup",
+    "doc_pipeline.phases.extraction",
+    "doc_pipeline.phases.generation",
+)
+
+
+def _prewarm_imports() -> None:
+    for name in _PREWARM_MODULES:
+        try:
+            importlib.import_module(name)
+        except Exception:
+            pass  # the real import reports the problem where it is needed
+
 
 # ── Tooltip helper (L9) ──────────────────────────────────────────────────────
 
 class ToolTip:
-    """Simple hover tooltip for any widget."""
+    """Simple hover tooltip for any widget.
+
+    All tooltips share one hidden Toplevel + Label, which is moved, relabelled
+    and shown on hover instead of being created and destroyed each time.
+    """
+
+    _shared_tw: tk.Toplevel | None = None
+    _shared_lbl: tk.Label | None = None
 
     def __init__(self, widget: tk.Widget, text: str) -> None:
         self.widget = widget
         self.text = text
-        self.tip_window: tk.Toplevel | None = None
         widget.bind("<Enter>", self._show)
         widget.bind("<Leave>", self._hide)
+        # The shared window is not a child of the widget, so it would outlive
+        # it; hide it when the widget goes away while hovered
+        widget.bind("<Unmap>", self._hide, add="+")
+        widget.bind("<Destroy>", self._hide, add="+")
+
+    @classmethod
+    def _window(cls, widget: tk.Widget) -> tuple[tk.Toplevel, tk.Label]:
+        tw = cls._shared_tw
+        try:
+            alive = tw is not None and tw.winfo_exists()
+        except tk.TclError:
+            alive = False  # its Tk root is gone
+        if not alive:
+            tw = tk.Toplevel(widget.winfo_toplevel())
+            tw.withdraw()
+            tw.wm_overrideredirect(True)
+            label = tk.Label(
+                tw,
+                background="#ffffe0",
+                relief="solid",
+                borderwidth=1,
+                font=("Arial", 9),
+            )
+            label.pack()
+            cls._shared_tw, cls._shared_lbl = tw, label
+        return cls._shared_tw, cls._shared_lbl
 
     def _show(self, event: tk.Event | None = None) -> None:
         try:
@@ -154,23 +580,67 @@ class ToolTip:
             bbox = None
         x = (bbox[0] if bbox else 0) + self.widget.winfo_rootx() + 25
         y = (bbox[1] if bbox else 0) + self.widget.winfo_rooty() + 25
-        self.tip_window = tw = tk.Toplevel(self.widget)
-        tw.wm_overrideredirect(True)
+        tw, label = self._window(self.widget)
+        label.configure(text=self.text)
         tw.wm_geometry(f"+{x}+{y}")
-        label = tk.Label(
-            tw,
-            text=self.text,
-            background="#ffffe0",
-            relief="solid",
-            borderwidth=1,
-            font=("Arial", 9),
-        )
-        label.pack()
+        tw.deiconify()
+        tw.lift()
 
     def _hide(self, event: tk.Event | None = None) -> None:
-        if self.tip_window:
-            self.tip_window.destroy()
-            self.tip_window = None
+        tw = ToolTip._shared_tw
+        try:
+            if tw is not None and tw.winfo_exists():
+                tw.withdraw()
+        except tk.TclError:
+            pass  # application is shutting down
+
+
+# ── Inline banners ───────────────────────────────────────────────────────────
+
+class _Banner(tk.Frame):
+    """Inline message banner (icon + text + close button).
+
+    Closing only unpacks it; :meth:`PipelineGUI._show_banner` recolours and
+    repacks a hidden banner instead of building a new frame and labels.
+    """
+
+    def __init__(self, master: tk.Widget) -> None:
+        super().__init__(master, highlightthickness=1, padx=12, pady=8)
+        self._msg = tk.Label(
+            self,
+            font=_BANNER_FONT,
+            anchor=tk.W,
+            wraplength=650,
+            justify=tk.LEFT,
+        )
+        self._msg.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        self._close = tk.Label(
+            self,
+            text="\u2715",
+            font=_BANNER_CLOSE_FONT,
+            cursor="hand2",
+            padx=4,
+        )
+        self._close.pack(side=tk.RIGHT)
+        self._close.bind("<Button-1>", lambda e: self.hide())
+        self.hidden = True
+        # Bumped on every show, so a stale auto-dismiss leaves a reused
+        # banner alone
+        self.shown = 0
+
+    def show(self, text: str, colors: dict[str, str]) -> None:
+        bg, fg = colors["bg"], colors["fg"]
+        self.configure(bg=bg, highlightbackground=colors["border"])
+        self._msg.configure(text=text, bg=bg, fg=fg)
+        self._close.configure(bg=bg, fg=fg)
+        self.pack(fill=tk.X, pady=(0, 4))
+        self.hidden = False
+        self.shown += 1
+
+    def hide(self) -> None:
+        if not self.hidden:
+            self.pack_forget()
+            self.hidden = True
 
 
 # ── Main Application ─────────────────────────────────────────────────────────
@@ -186,9 +656,8 @@ class PipelineGUI:
 
         # L3: Window icon
         try:
-            icon_path = Path(__file__).parent.parent.parent / "assets" / "icon.png"
-            if icon_path.exists():
-                img = tk.PhotoImage(file=str(icon_path))
+            if _ICON_EXISTS:
+                img = tk.PhotoImage(file=str(_ICON_PATH))
                 self.root.iconphoto(True, img)
         except Exception:
             pass  # No icon available, use default
@@ -196,14 +665,34 @@ class PipelineGUI:
         # WM_DELETE_WINDOW handler (C6)
         self.root.protocol("WM_DELETE_WINDOW", self._on_close)
 
-        # Message queue for background thread -> GUI communication
-        self._queue: queue.Queue[tuple[str, Any]] = queue.Queue()
-        self._buffered = _BufferedConsole()
+        # Background thread -> GUI communication. With a waker, Tk is woken
+        # by a self-pipe when output arrives; without one (Windows) _pump
+        # falls back to polling.
+        self._waker = _Waker.create(self.root, self._pump)
+        self._queue: queue.Queue[tuple[str, Any]] = _WakingQueue(self._waker)
+        self._buffered = _BufferedConsole(self._waker)
+        # Widgets/callback the pump feeds for the running task, and the id of
+        # its pending after() call
+        self._poll_ctx: tuple[tk.Text, ttk.Progressbar, Any, tk.StringVar | None] | None = None
+        self._pump_after: str | None = None
+        # One-off callbacks posted by worker threads (see _post_ui)
+        self._ui_calls: deque[Any] = deque()
         self._running = False  # Is a background task running?
+        # Worker thread for the pipeline phases (one runs at a time)
+        self._tasks = _TaskRunner()
 
         # Cancel event for long operations (H13)
         self._cancel_event = threading.Event()
 
+        # Status bar debounce: latest message not shown yet, pending after() id
+        self._status_pending: str | None = None
+        self._status_after: str | None = None
+
+        # Auto-dismissed banners as (deadline, banner, show count), oldest
+        # first, and the id of the single after() call that expires them
+        self._banner_expiry: deque[tuple[float, _Banner, int]] = deque()
+        self._banner_sweep_after: str | None = None
+
         # Deferred config error for UI building (M36)
         self._config_load_error: str | None = None
 
@@ -211,18 +700,46 @@ class PipelineGUI:
         self._step_labels: list[tk.Label] = []
         self._content_frame: tk.Frame | None = None
 
+        # Built step views kept for reuse: step -> (content frame, banner
+        # container). Dropped when a phase finishes or settings are saved.
+        self._step_frames: dict[int, tuple[ttk.Frame, ttk.Frame]] = {}
+        # Scrollable canvas of a step, to rebind the mouse wheel on revisit
+        self._step_canvases: dict[int, tk.Canvas] = {}
+
         # "Next step" button reference (shown after phase completion)
         self._next_step_btn: tk.Widget | None = None
 
-        # Mouse wheel binding id (for cleanup)
+        # Mouse wheel binding script, None when unbound (for cleanup)
         self._mousewheel_binding_id: str | None = None
 
-        # F4: Log search state — maps log widget id to search state dict
-        self._log_search_state: dict[str, dict[str, Any]] = {}
+        # F4: Log search state — maps log widget to search state dict; entries
+        # go away with their (destroyed) widget
+        self._log_search_state: weakref.WeakKeyDictionary[tk.Text, dict[str, Any]] = (
+            weakref.WeakKeyDictionary()
+        )
 
         # Collapsible log state: step_index -> {"collapsed": bool, "container": Frame, "toggle_var": StringVar, "line_count": int}
         self._log_states: dict[int, dict[str, Any]] = {}
 
+        # Log text waiting for the next idle flush: widget path -> chunks.
+        # A key is present exactly while a flush is scheduled for that widget.
+        self._log_pending: dict[str, list[str]] = {}
+
+        # Step availability (step -> prerequisites met), computed on demand;
+        # reset when a phase finishes or settings are saved
+        self._avail_cache: dict[int, bool] | None = None
+
+        # Recent existence checks: path -> (monotonic time, exists)
+        self._exists_cache: dict[Path, tuple[float, bool]] = {}
+
+        # Review preview text per extraction JSON: path -> (mtime_ns, text),
+        # and a counter identifying the latest preview request (older
+        # background loads are discarded)
+        self._preview_cache: OrderedDict[Path, tuple[int, str]] = OrderedDict()
+        self._preview_seq = 0
+        # Pending debounced _show_client_preview call
+        self._preview_after: str | None = None
+
         # Store settings-related widget refs for tooltips / API test (L9, F3)
         self._settings_entries: dict[str, tk.StringVar] = {}
         self._api_key_var: tk.StringVar | None = None
@@ -234,6 +751,9 @@ class PipelineGUI:
         self._build_ui()
         self._bind_keyboard_shortcuts()
         self._show_step(0)
+        self.root.after_idle(
+            lambda: threading.Thread(target=_prewarm_imports, daemon=True).start()
+        )
 
     # ── WM_DELETE_WINDOW handler (C6) ─────────────────────────────────────
 
@@ -245,10 +765,16 @@ class PipelineGUI:
                 "Operacija je u tijeku. Jeste li sigurni da \u017eelite zatvoriti?",
             ):
                 self._cancel_event.set()
-                self.root.destroy()
+                self._destroy()
             # else: do nothing, user chose not to close
         else:
-            self.root.destroy()
+            self._destroy()
+
+    def _destroy(self) -> None:
+        if self._waker is not None:
+            self._waker.close()
+            self._waker = None
+        self.root.destroy()
 
     # ── Keyboard shortcuts (L1) ──────────────────────────────────────────
 
@@ -266,7 +792,7 @@ class PipelineGUI:
         for i in range(1, 6):
             self.root.bind_all(
                 f"<{mod}-Key-{i}>",
-                lambda e, step=i - 1: self._on_shortcut_step(step),
+                functools.partial(self._on_shortcut_step_event, step=i - 1),
             )
         # Ctrl/Cmd+F: Focus log search (F4)
         self.root.bind_all(f"<{mod}-f>", self._on_shortcut_search)
@@ -309,6 +835,12 @@ class PipelineGUI:
             self._on_cancel_click()
         return "break"
 
+    def _on_shortcut_step_event(self, event: tk.Event, step: int) -> str:
+        return self._on_shortcut_step(step)
+
+    def _on_step_click_event(self, event: tk.Event, step: int) -> None:
+        self._on_step_click(step)
+
     def _on_shortcut_step(self, step: int) -> str:
         """Ctrl/Cmd+N: Navigate directly to step N (internal index N-1).
 
@@ -321,9 +853,11 @@ class PipelineGUI:
     def _on_shortcut_search(self, event: tk.Event) -> str:
         """Ctrl/Cmd+F: Focus the log search field on the current step."""
         # Find the search entry for the current step's log widget
-        for wid, state in self._log_search_state.items():
+        for state in self._log_search_state.values():
+            if state["step"] != self._current_step:
+                continue
             entry = state.get("entry")
-            if entry and entry.winfo_exists():
+            if _is_alive(entry):
                 entry.focus_set()
                 entry.select_range(0, tk.END)
                 return "break"
@@ -332,107 +866,8 @@ class PipelineGUI:
     # ── UI construction ──────────────────────────────────────────────────
 
     def _build_ui(self) -> None:
-        # Use ttk theme — clam renders custom button colors on macOS;
-        # aqua ignores bg/fg, making styled buttons invisible.
-        style = ttk.Style()
-        available = style.theme_names()
-        for preferred in ("clam", "alt", "default"):
-            if preferred in available:
-                style.theme_use(preferred)
-                break
+        _configure_styles()
 
-        # ── Button styles (color-coded hierarchy) ──
-        style.configure(
-            "Primary.TButton",
-            background="#2980b9",
-            foreground="white",
-            font=("Arial", 11, "bold"),
-            padding=(16, 8),
-        )
-        style.map(
-            "Primary.TButton",
-            background=[("active", "#2471a3"), ("pressed", "#1a5276"), ("disabled", "#85929e")],
-            foreground=[("disabled", "#bdc3c7")],
-        )
-
-        style.configure(
-            "Secondary.TButton",
-            background="#ecf0f1",
-            foreground="#2c3e50",
-            font=("Arial", 10),
-            padding=(12, 6),
-        )
-        style.map(
-            "Secondary.TButton",
-            background=[("active", "#d5dbdb"), ("pressed", "#bdc3c7"), ("disabled", "#f0f0f0")],
-            foreground=[("disabled", "#bdc3c7")],
-        )
-
-        style.configure(
-            "Danger.TButton",
-            background="#e74c3c",
-            foreground="white",
-            font=("Arial", 10),
-            padding=(12, 6),
-        )
-        style.map(
-            "Danger.TButton",
-            background=[("active", "#cb4335"), ("pressed", "#a93226"), ("disabled", "#85929e")],
-            foreground=[("disabled", "#bdc3c7")],
-        )
-
-        style.configure(
-            "Success.TButton",
-            background="#27ae60",
-            foreground="white",
-            font=("Arial", 11, "bold"),
-            padding=(16, 8),
-        )
-        style.map(
-            "Success.TButton",
-            background=[("active", "#229954"), ("pressed", "#1e8449"), ("disabled", "#85929e")],
-            foreground=[("disabled", "#bdc3c7")],
-        )
-
-        style.configure(
-            "LogToggle.TButton",
-            font=("Arial", 9, "bold"),
-            padding=(8, 2),
-        )
-
-        # Configure custom styles
-        style.configure("Sidebar.TFrame", background="#2c3e50")
-        style.configure(
-            "SidebarStep.TLabel",
-            background="#2c3e50",
-            foreground="#95a5a6",
-            font=("Arial", 11),
-            padding=(12, 8),
-        )
-        style.configure(
-            "SidebarStepActive.TLabel",
-            background="#34495e",
-            foreground="#ecf0f1",
-            font=("Arial", 11, "bold"),
-            padding=(12, 8),
-        )
-        style.configure(
-            "SidebarStepDone.TLabel",
-            background="#2c3e50",
-            foreground="#2ecc71",
-            font=("Arial", 11),
-            padding=(12, 8),
-        )
-        style.configure(
-            "SidebarStepLocked.TLabel",
-            background="#2c3e50",
-            foreground="#4a5568",
-            font=("Arial", 11),
-            padding=(12, 8),
-        )
-        style.configure("Status.TLabel", font=("Arial", 10), padding=(8, 4))
-        style.configure("Title.TLabel", font=("Arial", 14, "bold"))
-        style.configure("Subtitle.TLabel", font=("Arial", 10), foreground="#7f8c8d")
         # Top-level layout — fixed sidebar + expanding content.
         # PanedWindow was unreliable for sidebar width on macOS;
         # pack with pack_propagate(False) guarantees a fixed sidebar.
@@ -477,9 +912,9 @@ class PipelineGUI:
                 cursor="hand2",
             )
             lbl.pack(fill=tk.X)
-            step_idx = i
-            lbl.bind("<Button-1>", lambda e, s=step_idx: self._on_step_click(s))
-            step_frame.bind("<Button-1>", lambda e, s=step_idx: self._on_step_click(s))
+            on_click = functools.partial(self._on_step_click_event, step=i)
+            lbl.bind("<Button-1>", on_click)
+            step_frame.bind("<Button-1>", on_click)
             self._step_labels.append(lbl)
 
         # L1: Keyboard shortcut help text at bottom of sidebar
@@ -522,28 +957,56 @@ class PipelineGUI:
 
     def _is_step_available(self, step: int) -> bool:
         """Check whether prerequisites for the given step are met."""
-        # Step 0 (Settings) and Step 1 (Setup) are always available
-        if step <= 1:
-            return True
+        if self._avail_cache is None:
+            self._avail_cache = self._compute_availability()
+        return self._avail_cache.get(step, True)
 
+    def _compute_availability(self) -> dict[int, bool]:
+        # Step 0 (Settings) and Step 1 (Setup) are always available
+        avail = {0: True, 1: True}
         try:
-            from doc_pipeline.config import load_config
             cfg = load_config()
         except Exception:
             # If config can't load, only settings step is safe
-            return step == 0
+            avail.update({2: False, 3: False, 4: False})
+            return avail
+
+        # Extraction requires inventory from Setup
+        avail[2] = self._exists_cached(cfg.inventory_path)
+        # Review and Generation require the spreadsheet from Extraction
+        avail[3] = avail[4] = self._exists_cached(cfg.spreadsheet_path)
+        return avail
 
-        if step == 2:
-            # Extraction requires inventory from Setup
-            return cfg.inventory_path.exists()
-        elif step == 3:
-            # Review requires spreadsheet from Extraction
-            return cfg.spreadsheet_path.exists()
-        elif step == 4:
-            # Generation requires spreadsheet (reviewed)
-            return cfg.spreadsheet_path.exists()
+    def _invalidate_availability(self) -> None:
+        self._avail_cache = None
+        self._exists_cache.clear()
 
-        return True
+    def _mark_available(self, *steps: int) -> None:
+        """Record that a phase just produced what *steps* need, without re-checking disk."""
+        self._exists_cache.clear()
+        if self._avail_cache is not None:
+            self._avail_cache.update(dict.fromkeys(steps, True))
+
+    def _exists_cached(self, path: Path) -> bool:
+        """path.exists(), reusing a result younger than _EXISTS_TTL_S.
+
+        Cleared whenever a phase finishes, so files it produced show up at once.
+        """
+        now = time.monotonic()
+        hit = self._exists_cache.get(path)
+        if hit is not None and now - hit[0] < _EXISTS_TTL_S:
+            return hit[1]
+        exists = path.exists()
+        self._exists_cache[path] = (now, exists)
+        return exists
+
+    def _invalidate_step_frames(self) -> None:
+        """Drop cached step views (except the visible one) so they are rebuilt."""
+        for step, (frame, _banners) in list(self._step_frames.items()):
+            if step != self._current_step:
+                frame.destroy()
+                del self._step_frames[step]
+                self._step_canvases.pop(step, None)
 
     def _show_step(self, step: int) -> None:
         self._current_step = step
@@ -553,15 +1016,32 @@ class PipelineGUI:
         # Unbind mouse wheel from previous view (M37 cleanup)
         self._unbind_mousewheel()
 
-        # Clear content
+        # Hide the previous view; it stays built for the next visit
         if self._content_frame is not None:
-            self._content_frame.destroy()
-        self._content_frame = ttk.Frame(self._content_outer, padding=16)
-        self._content_frame.pack(fill=tk.BOTH, expand=True)
+            self._content_frame.pack_forget()
 
         # Reset next-step button reference
         self._next_step_btn = None
 
+        cached = self._step_frames.get(step)
+        if cached is not None:
+            self._content_frame, self._banner_container = cached
+            self._content_frame.pack(fill=tk.BOTH, expand=True)
+            canvas = self._step_canvases.get(step)
+            if canvas is not None:
+                self._bind_mousewheel(canvas)
+            # Files on disk may have changed since the view was built
+            if step == 1:
+                self._refresh_setup_info()
+            elif step == 2:
+                self._refresh_extraction_info()
+            elif step == 4:
+                self._refresh_auto_annex_number()
+            return
+
+        self._content_frame = ttk.Frame(self._content_outer, padding=16)
+        self._content_frame.pack(fill=tk.BOTH, expand=True)
+
         # Banner container (sits at top of content area)
         self._banner_container = ttk.Frame(self._content_frame)
         self._banner_container.pack(fill=tk.X, pady=(0, 4))
@@ -575,6 +1055,7 @@ class PipelineGUI:
             self._build_generation,
         ]
         builders[step](self._content_frame)
+        self._step_frames[step] = (self._content_frame, self._banner_container)
 
     def _update_sidebar(self) -> None:
         for i, lbl in enumerate(self._step_labels):
@@ -606,7 +1087,22 @@ class PipelineGUI:
                     lbl.configure(cursor="arrow")
 
     def _set_status(self, msg: str) -> None:
+        """Show msg in the status bar, at most once per _STATUS_INTERVAL_MS.
+
+        The first update is shown at once; updates arriving within the
+        interval are coalesced and only the latest one is shown when it ends.
+        """
+        if self._status_after is not None:
+            self._status_pending = msg
+            return
         self._status_var.set(msg)
+        self._status_after = self.root.after(_STATUS_INTERVAL_MS, self._flush_status)
+
+    def _flush_status(self) -> None:
+        self._status_after = None
+        msg, self._status_pending = self._status_pending, None
+        if msg is not None:
+            self._set_status(msg)
 
     # ── Helpers for content building ────────────────────────────────────
 
@@ -632,6 +1128,7 @@ class PipelineGUI:
         command: Any,
         style: str = "secondary",
         width: int | None = None,
+        name: str | None = None,
     ) -> ttk.Button:
         """Create a styled ttk button with color hierarchy.
 
@@ -639,7 +1136,9 @@ class PipelineGUI:
         Uses ttk.Button with clam theme for cross-platform color rendering.
         """
         ttk_style = self._BUTTON_STYLES.get(style, "Secondary.TButton")
-        btn = ttk.Button(parent, text=text, command=command, style=ttk_style, cursor="hand2")
+        btn = ttk.Button(
+            parent, name=name, text=text, command=command, style=ttk_style, cursor="hand2"
+        )
         if width:
             btn.configure(width=width)
         return btn
@@ -699,7 +1198,7 @@ class PipelineGUI:
         log = tk.Text(
             frame,
             wrap=tk.WORD,
-            font=("Consolas" if sys.platform == "win32" else "Menlo", 10),
+            font=_FIXED_FONT,
             bg="#1e1e1e",
             fg="#d4d4d4",
             insertbackground="#d4d4d4",
@@ -713,23 +1212,36 @@ class PipelineGUI:
         # Configure search highlight tag
         log.tag_configure("search_highlight", background="#b58900", foreground="#1e1e1e")
 
-        # F4: Store search state
-        wid = str(id(log))
-        self._log_search_state[wid] = {
+        # F4: Store search state (no reference back to the log, or the weak
+        # key would never be released)
+        self._log_search_state[log] = {
             "entry": search_entry,
             "var": search_var,
             "match_index": 0,
-            "matches": [],
-            "log": log,
+            # Character offsets of the matches, and the line start offsets
+            # of the text they were found in (to turn them into "line.col")
+            "matches": array.array("i"),
+            "match_lines": [0],
+            "step": step_idx,
+            # Term the current highlights belong to, and the pending
+            # search-as-you-type job
+            "term": "",
+            "search_after": None,
+            # Bumped on every change to the log text; buf_cache holds
+            # (revision, text, line_starts) from the last search
+            "revision": 0,
+            "buf_cache": None,
+            # (revision, flat start/end index list) of the current highlights
+            "highlight": None,
+            # (term, compiled case-insensitive pattern) of the last search
+            "pattern": None,
         }
 
         # Wire up search actions
         search_btn.configure(command=lambda: self._log_search(log))
         next_btn.configure(command=lambda: self._log_search_next(log))
         search_entry.bind("<Return>", lambda e: self._log_search(log))
-        search_var.trace_add(
-            "write", lambda *_: self._log_search_clear(log) if not search_var.get() else None
-        )
+        search_entry.bind("<KeyRelease>", lambda e: self._on_search_keyrelease(log))
 
         # L6: Wire up save button
         save_btn.configure(command=lambda: self._save_log(log, step_name))
@@ -741,6 +1253,7 @@ class PipelineGUI:
             "toggle_var": toggle_var,
             "toggle_btn": toggle_btn,
             "line_count": 0,
+            "log": log,
         }
 
         def _toggle_log() -> None:
@@ -777,8 +1290,8 @@ class PipelineGUI:
         """Handle cancel button click."""
         self._cancel_event.set()
         for attr in ("_setup_cancel_btn", "_extract_cancel_btn", "_gen_cancel_btn"):
-            btn = getattr(self, attr, None)
-            if btn and btn.winfo_exists():
+            btn = self._live_widget(attr)
+            if btn is not None:
                 btn.configure(state=tk.DISABLED)
         self._set_status("Otkazivanje...")
 
@@ -798,18 +1311,47 @@ class PipelineGUI:
             bar.start(10)
 
     def _log_append(self, log_widget: tk.Text, text: str) -> None:
+        """Queue text for the log; all appends in one Tk tick share one insert."""
+        key = str(log_widget)
+        pending = self._log_pending.get(key)
+        if pending is not None:
+            pending.append(text)
+            return
+        self._log_pending[key] = [text]
+        self.root.after_idle(self._flush_log, log_widget)
+
+    def _flush_log(self, log_widget: tk.Text) -> None:
+        chunks = self._log_pending.pop(str(log_widget), None)
+        if not chunks or not _is_alive(log_widget):
+            return
+
+        text = "".join(chunks)
+        # Look the log's state up by its own step, not the visible one: a
+        # running task keeps writing while the user looks at another step
+        search_state = self._log_search_state.get(log_widget)
+        state = None
+        if search_state is not None:
+            search_state["revision"] += 1
+            state = self._log_states.get(search_state["step"])
+            if state is not None and state.get("log") is not log_widget:
+                state = None
+
         log_widget.configure(state=tk.NORMAL)
         log_widget.insert(tk.END, text)
-        # H18: Bounded log area
-        line_count = int(log_widget.index("end-1c").split(".")[0])
+        # H18: Bounded log area. The count mirrors the line number of
+        # "end-1c" (newlines + 1), kept up to date without asking Tk.
+        if state is not None:
+            line_count = max(state["line_count"], 1) + text.count("\n")
+        else:
+            line_count = int(log_widget.index("end-1c").split(".")[0])
         if line_count > MAX_LOG_LINES:
-            log_widget.delete("1.0", f"{line_count - MAX_LOG_LINES}.0")
+            # Keep the last MAX_LOG_LINES lines: delete up to the first of them
+            log_widget.delete("1.0", f"{line_count - MAX_LOG_LINES + 1}.0")
             line_count = MAX_LOG_LINES
         log_widget.see(tk.END)
         log_widget.configure(state=tk.DISABLED)
 
         # Update collapsible log state
-        state = self._log_states.get(self._current_step)
         if state:
             state["line_count"] = line_count
             # Auto-expand on first content
@@ -823,34 +1365,52 @@ class PipelineGUI:
 
     def _log_search(self, log_widget: tk.Text) -> None:
         """Highlight all matches of the search term in the log."""
-        wid = str(id(log_widget))
-        state = self._log_search_state.get(wid)
+        state = self._log_search_state.get(log_widget)
         if not state:
             return
+        if state["search_after"] is not None:
+            self.root.after_cancel(state["search_after"])
+            state["search_after"] = None
         term = state["var"].get().strip()
         if not term:
             self._log_search_clear(log_widget)
             return
+        state["term"] = term
 
         # Clear previous highlights
-        log_widget.tag_remove("search_highlight", "1.0", tk.END)
-        state["matches"] = []
+        self._remove_highlights(log_widget, state)
         state["match_index"] = 0
 
-        # Find all occurrences
-        start_pos = "1.0"
-        while True:
-            pos = log_widget.search(term, start_pos, stopindex=tk.END, nocase=True)
-            if not pos:
-                break
-            end_pos = f"{pos}+{len(term)}c"
-            log_widget.tag_add("search_highlight", pos, end_pos)
-            state["matches"].append(pos)
-            start_pos = end_pos
+        # Scan the text once in Python, map offsets to "line.col" indices,
+        # then highlight all matches with one tag_add call. Text and line
+        # offsets are reused until the log changes.
+        cache = state["buf_cache"]
+        if cache is not None and cache[0] == state["revision"]:
+            _rev, text, line_starts = cache
+        else:
+            text = log_widget.get("1.0", "end-1c")
+            line_starts = list(
+                itertools.accumulate((len(line) + 1 for line in text.split("\n")), initial=0)
+            )
+            state["buf_cache"] = (state["revision"], text, line_starts)
+        pattern = state["pattern"]
+        if pattern is None or pattern[0] != term:
+            pattern = state["pattern"] = (term, re.compile(re.escape(term), re.IGNORECASE))
+        matches = array.array("i")
+        ranges: list[str] = []
+        for m in pattern[1].finditer(text):
+            start, end = m.span()
+            matches.append(start)
+            ranges += (_text_index(line_starts, start), _text_index(line_starts, end))
+        state["matches"] = matches
+        state["match_lines"] = line_starts
+        if ranges:
+            log_widget.tag_add("search_highlight", *ranges)
+            state["highlight"] = (state["revision"], ranges)
 
         # Jump to first match
-        if state["matches"]:
-            log_widget.see(state["matches"][0])
+        if matches:
+            log_widget.see(ranges[0])
             self._set_status(
                 f"Prona\u0111eno {len(state['matches'])} rezultata"
             )
@@ -859,31 +1419,65 @@ class PipelineGUI:
 
     def _log_search_next(self, log_widget: tk.Text) -> None:
         """Jump to the next search match."""
-        wid = str(id(log_widget))
-        state = self._log_search_state.get(wid)
+        state = self._log_search_state.get(log_widget)
         if not state or not state["matches"]:
             return
         state["match_index"] = (state["match_index"] + 1) % len(state["matches"])
-        pos = state["matches"][state["match_index"]]
+        pos = _text_index(state["match_lines"], state["matches"][state["match_index"]])
         log_widget.see(pos)
         self._set_status(
             f"Rezultat {state['match_index'] + 1}/{len(state['matches'])}"
         )
 
+    def _on_search_keyrelease(self, log_widget: tk.Text) -> None:
+        """Search as the user types, once they pause for 150 ms."""
+        state = self._log_search_state.get(log_widget)
+        if not state:
+            return
+        if state["search_after"] is not None:
+            self.root.after_cancel(state["search_after"])
+
+        def _search_if_changed() -> None:
+            state["search_after"] = None
+            # Return already searched; arrow keys etc. leave the term as is
+            if _is_alive(log_widget) and state["var"].get().strip() != state["term"]:
+                self._log_search(log_widget)
+
+        state["search_after"] = self.root.after(150, _search_if_changed)
+
+    @staticmethod
+    def _remove_highlights(log_widget: tk.Text, state: dict[str, Any]) -> None:
+        """Untag the last search's matches.
+
+        The stored ranges are only valid while the log is unchanged (trimming
+        shifts line numbers); otherwise clear the tag over the whole log.
+        """
+        highlight = state["highlight"]
+        state["highlight"] = None
+        if highlight is None:
+            return
+        revision, ranges = highlight
+        if revision == state["revision"]:
+            log_widget.tag_remove("search_highlight", *ranges)
+        else:
+            log_widget.tag_remove("search_highlight", "1.0", tk.END)
+
     def _log_search_clear(self, log_widget: tk.Text) -> None:
         """Clear search highlights."""
-        log_widget.tag_remove("search_highlight", "1.0", tk.END)
-        wid = str(id(log_widget))
-        state = self._log_search_state.get(wid)
-        if state:
-            state["matches"] = []
+        state = self._log_search_state.get(log_widget)
+        if not state:
+            log_widget.tag_remove("search_highlight", "1.0", tk.END)
+        else:
+            self._remove_highlights(log_widget, state)
+            state["matches"] = array.array("i")
             state["match_index"] = 0
+            state["term"] = ""
 
     # ── L6: Log save method ───────────────────────────────────────────────
 
     def _save_log(self, log_widget: tk.Text, step_name: str) -> None:
         """Save log contents to a text file."""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
         default_name = f"pipeline_log_{step_name}_{timestamp}.txt"
         filepath = filedialog.asksaveasfilename(
             title="Spremi zapisnik",
@@ -894,8 +1488,12 @@ class PipelineGUI:
         if not filepath:
             return
         try:
-            content = log_widget.get("1.0", tk.END)
-            Path(filepath).write_text(content, encoding="utf-8")
+            # Copy out of Tk a block of lines at a time instead of the whole
+            # log as one string
+            end_line = int(log_widget.index(tk.END).split(".")[0])
+            with open(filepath, "w", encoding="utf-8", buffering=1 << 20) as fh:
+                for line in range(1, end_line, _SAVE_LOG_CHUNK_LINES):
+                    fh.write(log_widget.get(f"{line}.0", f"{line + _SAVE_LOG_CHUNK_LINES}.0"))
             self._set_status(f"Zapisnik spremljen: {Path(filepath).name}")
         except Exception as exc:
             messagebox.showerror(
@@ -907,13 +1505,17 @@ class PipelineGUI:
         """Add a prominent 'Continue to Next Step' button after phase completion."""
         if next_step >= len(STEPS):
             return
-        btn = self._make_button(
-            parent,
-            text="Nastavi na sljede\u0107i korak \u2192",
-            command=lambda: self._show_step(next_step),
-            style="success",
-        )
-        btn.pack(anchor=tk.W, pady=(8, 0))
+        # The view is kept between visits: reuse its button from an earlier run
+        btn = parent.children.get("next_step")
+        if btn is None:
+            btn = self._make_button(
+                parent,
+                text="Nastavi na sljede\u0107i korak \u2192",
+                command=lambda: self._show_step(next_step),
+                style="success",
+                name="next_step",
+            )
+            btn.pack(anchor=tk.W, pady=(8, 0))
         self._next_step_btn = btn
 
     def _show_banner(
@@ -924,61 +1526,63 @@ class PipelineGUI:
         Levels: 'success', 'error', 'warning', 'info'.
         Auto-dismiss defaults to True for success/info, False for error/warning.
         """
-        colors = {
-            "success": {"bg": "#d4edda", "fg": "#155724", "border": "#28a745", "icon": "\u2713"},
-            "error":   {"bg": "#f8d7da", "fg": "#721c24", "border": "#dc3545", "icon": "\u2717"},
-            "warning": {"bg": "#fff3cd", "fg": "#856404", "border": "#ffc107", "icon": "\u26a0"},
-            "info":    {"bg": "#d1ecf1", "fg": "#0c5460", "border": "#17a2b8", "icon": "\u2139"},
-        }
-        c = colors.get(level, colors["info"])
+        c = _BANNER_COLORS.get(level, _BANNER_COLORS["info"])
         if auto_dismiss is None:
             auto_dismiss = level in ("success", "info")
 
-        banner = tk.Frame(
-            self._banner_container,
-            bg=c["bg"],
-            highlightbackground=c["border"],
-            highlightthickness=1,
-            padx=12,
-            pady=8,
-        )
-        banner.pack(fill=tk.X, pady=(0, 4))
-
-        # Icon + message
-        tk.Label(
-            banner,
-            text=f"{c['icon']}  {message}",
-            bg=c["bg"],
-            fg=c["fg"],
-            font=("Arial", 10),
-            anchor=tk.W,
-            wraplength=650,
-            justify=tk.LEFT,
-        ).pack(side=tk.LEFT, fill=tk.X, expand=True)
-
-        # Close button
-        close_btn = tk.Label(
-            banner,
-            text="\u2715",
-            bg=c["bg"],
-            fg=c["fg"],
-            font=("Arial", 10, "bold"),
-            cursor="hand2",
-            padx=4,
-        )
-        close_btn.pack(side=tk.RIGHT)
-        close_btn.bind("<Button-1>", lambda e: banner.destroy())
+        # Reuse a closed banner of this step if there is one (children is a
+        # plain dict, no Tcl round-trip)
+        banner = next(
+            (
+                w for w in self._banner_container.children.values()
+                if isinstance(w, _Banner) and w.hidden
+            ),
+            None,
+        ) or _Banner(self._banner_container)
+        banner.show(f"{c['icon']}  {message}", c)
 
         if auto_dismiss:
-            self.root.after(5000, lambda: banner.destroy() if banner.winfo_exists() else None)
+            self._banner_expiry.append(
+                (time.monotonic() + _BANNER_DISMISS_S, banner, banner.shown)
+            )
+            if self._banner_sweep_after is None:
+                self._schedule_banner_sweep()
 
         return banner
 
+    def _schedule_banner_sweep(self) -> None:
+        delay = self._banner_expiry[0][0] - time.monotonic()
+        self._banner_sweep_after = self.root.after(
+            max(0, int(delay * 1000) + 1), self._sweep_banners
+        )
+
+    def _sweep_banners(self) -> None:
+        """Hide banners whose time is up; one timer serves all of them."""
+        self._banner_sweep_after = None
+        now = time.monotonic()
+        expiry = self._banner_expiry
+        while expiry and expiry[0][0] <= now:
+            _deadline, banner, shown = expiry.popleft()
+            # Skip banners closed (and possibly reused) in the meantime
+            if banner.shown == shown and _is_alive(banner):
+                banner.hide()
+        if expiry:
+            self._schedule_banner_sweep()
+
+    def _live_widget(self, name: str) -> Any:
+        """Widget attribute *name* if it has been built and not destroyed, else None."""
+        widget = getattr(self, name, None)
+        return widget if _is_alive(widget) else None
+
     def _clear_banners(self) -> None:
         """Remove all banners from the banner container."""
-        if hasattr(self, "_banner_container") and self._banner_container.winfo_exists():
-            for child in self._banner_container.winfo_children():
-                child.destroy()
+        container = self._live_widget("_banner_container")
+        if container is not None:
+            for child in list(container.children.values()):
+                if isinstance(child, _Banner):
+                    child.hide()
+                else:
+                    child.destroy()
 
     def _load_config_safe(self, quiet: bool = False) -> Any:
         """Load config, return None on error.
@@ -987,7 +1591,6 @@ class PipelineGUI:
         error for later display.  A warning label should be shown instead.
         """
         try:
-            from doc_pipeline.config import load_config
             self._config_load_error = None
             return load_config()
         except Exception as exc:
@@ -1015,17 +1618,17 @@ class PipelineGUI:
 
     def _bind_mousewheel(self, canvas: tk.Canvas) -> None:
         """Bind mouse wheel scrolling to the canvas."""
+        # A plain Tcl script: each wheel event scrolls the canvas inside Tcl
+        # without a round-trip through a Python callback. Tcl's integer
+        # division floors like Python's //.
         if platform.system() == "Darwin":
-            self._mousewheel_binding_id = canvas.bind_all(
-                "<MouseWheel>",
-                lambda e: canvas.yview_scroll(-1 * e.delta, "units"),
-            )
+            script = f"{canvas} yview scroll [expr {{-(%D)}}] units"
         else:
-            self._mousewheel_binding_id = canvas.bind_all(
-                "<MouseWheel>",
-                lambda e: canvas.yview_scroll(-1 * (e.delta // 120), "units"),
-            )
+            script = f"{canvas} yview scroll [expr {{-(%D / 120)}}] units"
+        canvas.bind_all("<MouseWheel>", script)
+        self._mousewheel_binding_id = script
         self._mousewheel_canvas = canvas
+        self._step_canvases[self._current_step] = canvas
 
     def _unbind_mousewheel(self) -> None:
         """Unbind mouse wheel events to avoid affecting other scrollable widgets."""
@@ -1072,106 +1675,67 @@ class PipelineGUI:
         # M37: Mouse wheel scrolling on settings canvas
         self._bind_mousewheel(canvas)
 
+        form_frame.columnconfigure(1, weight=1)
+
         row = 0
         entries: dict[str, tk.StringVar] = {}
-        # L9: collect entry widgets for tooltips
-        entry_widgets: dict[str, ttk.Entry] = {}
-
-        def add_field(
-            label: str, key: str, default: str = "", masked: bool = False
-        ) -> ttk.Entry:
-            nonlocal row
-            ttk.Label(form_frame, text=label, font=("Arial", 10)).grid(
-                row=row, column=0, sticky=tk.W, padx=(0, 12), pady=4
-            )
-            var = tk.StringVar(value=default)
-            entries[key] = var
-            entry = ttk.Entry(form_frame, textvariable=var, width=60)
-            if masked:
-                entry.configure(show="*")
-            entry.grid(row=row, column=1, sticky=tk.EW, pady=4)
-            entry_widgets[key] = entry
-            row += 1
-            return entry
-
-        def add_folder_field(
-            label: str, key: str, default: str = ""
-        ) -> ttk.Entry:
-            nonlocal row
-            ttk.Label(form_frame, text=label, font=("Arial", 10)).grid(
-                row=row, column=0, sticky=tk.W, padx=(0, 12), pady=4
-            )
-            var = tk.StringVar(value=default)
-            entries[key] = var
-            frame = ttk.Frame(form_frame)
-            frame.grid(row=row, column=1, sticky=tk.EW, pady=4)
-            entry = ttk.Entry(frame, textvariable=var, width=50)
-            entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
-            btn = ttk.Button(
-                frame,
-                text="...",
-                width=3,
-                command=lambda v=var: self._pick_folder(v),
+        for section_idx, (title, fields) in enumerate(_SETTINGS_FORM):
+            ttk.Label(form_frame, text=title, font=("Arial", 11, "bold")).grid(
+                row=row, column=0, columnspan=2, sticky=tk.W,
+                pady=(16 if section_idx else 8, 4),
             )
-            btn.pack(side=tk.RIGHT, padx=(4, 0))
-            entry_widgets[key] = entry
             row += 1
-            return entry
-
-        form_frame.columnconfigure(1, weight=1)
 
-        # Section: Paths
-        ttk.Label(form_frame, text="Putanje", font=("Arial", 11, "bold")).grid(
-            row=row, column=0, columnspan=2, sticky=tk.W, pady=(8, 4)
-        )
-        row += 1
-
-        add_folder_field(
-            "Mapa s ugovorima:",
-            "paths.source",
-            cfg.paths.source if cfg else "./contracts",
-        )
+            for label, key, kind, fallback, tip in fields:
+                ttk.Label(form_frame, text=label, font=("Arial", 10)).grid(
+                    row=row, column=0, sticky=tk.W, padx=(0, 12), pady=4
+                )
+                var = tk.StringVar(value=_settings_value(cfg, key) if cfg else fallback)
+                entries[key] = var
+                if kind == "folder":
+                    frame = ttk.Frame(form_frame)
+                    frame.grid(row=row, column=1, sticky=tk.EW, pady=4)
+                    entry = ttk.Entry(frame, textvariable=var, width=50)
+                    entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
+                    ttk.Button(
+                        frame,
+                        text="...",
+                        width=3,
+                        command=lambda v=var: self._pick_folder(v),
+                    ).pack(side=tk.RIGHT, padx=(4, 0))
+                else:
+                    entry = ttk.Entry(
+                        form_frame,
+                        textvariable=var,
+                        width=60,
+                        show="*" if kind == "masked" else "",
+                    )
+                    entry.grid(row=row, column=1, sticky=tk.EW, pady=4)
+                # L9: tooltips on key settings fields
+                if tip:
+                    ToolTip(entry, tip)
+                if key == "api_key":
+                    self._build_api_test(form_frame, row)
+                row += 1
 
-        # Section: Company info
-        ttk.Label(
-            form_frame, text="Podaci o tvrtki", font=("Arial", 11, "bold")
-        ).grid(row=row, column=0, columnspan=2, sticky=tk.W, pady=(16, 4))
-        row += 1
-
-        add_field(
-            "Naziv tvrtke:",
-            "general.company_name",
-            cfg.general.company_name if cfg else "",
-        )
-        add_field("OIB:", "general.company_oib", cfg.general.company_oib if cfg else "")
-        add_field(
-            "Adresa:",
-            "general.company_address",
-            cfg.general.company_address if cfg else "",
-        )
-        add_field(
-            "Direktor:",
-            "general.company_director",
-            cfg.general.company_director if cfg else "",
-        )
+        # Save button
+        btn_frame = ttk.Frame(form_frame)
+        btn_frame.grid(row=row, column=0, columnspan=2, pady=(20, 8))
 
-        # Section: API
-        ttk.Label(
-            form_frame, text="API / Ekstrakcija", font=("Arial", 11, "bold")
-        ).grid(row=row, column=0, columnspan=2, sticky=tk.W, pady=(16, 4))
-        row += 1
-
-        add_field(
-            "Anthropic API klju\u010d:",
-            "api_key",
-            cfg.anthropic_api_key if cfg else "",
-            masked=True,
-        )
+        self._make_button(
+            btn_frame,
+            "Spremi postavke",
+            lambda: self._save_settings(entries),
+            style="primary",
+        ).pack()
 
-        # F3: API test button — placed on same row as API key, in column 2
+        self._settings_entries = entries
         self._api_key_var = entries["api_key"]
+
+    def _build_api_test(self, form_frame: ttk.Frame, row: int) -> None:
+        """F3: API test button — placed on same row as API key, in column 2."""
         api_test_frame = ttk.Frame(form_frame)
-        api_test_frame.grid(row=row - 1, column=2, padx=(8, 0), pady=4)
+        api_test_frame.grid(row=row, column=2, padx=(8, 0), pady=4)
         self._api_test_btn = ttk.Button(
             api_test_frame,
             text="Testiraj API",
@@ -1183,43 +1747,6 @@ class PipelineGUI:
         )
         self._api_test_status.pack(side=tk.LEFT, padx=(6, 0))
 
-        # Section: Generation
-        ttk.Label(
-            form_frame, text="Generiranje", font=("Arial", 11, "bold")
-        ).grid(row=row, column=0, columnspan=2, sticky=tk.W, pady=(16, 4))
-        row += 1
-
-        add_field(
-            "Datum stupanja na snagu (GGGG-MM-DD):",
-            "generation.default_effective_date",
-            cfg.generation.default_effective_date if cfg else "2026-03-01",
-        )
-
-        # Save button
-        btn_frame = ttk.Frame(form_frame)
-        btn_frame.grid(row=row, column=0, columnspan=2, pady=(20, 8))
-
-        self._make_button(
-            btn_frame,
-            "Spremi postavke",
-            lambda: self._save_settings(entries),
-            style="primary",
-        ).pack()
-
-        self._settings_entries = entries
-
-        # L9: Attach tooltips to key settings fields
-        _tooltips = {
-            "general.company_oib": "OIB mora sadr\u017eavati to\u010dno 11 znamenki",
-            "generation.default_effective_date": "Format: GGGG-MM-DD (npr. 2026-03-01)",
-            "api_key": "Anthropic API klju\u010d (po\u010dinje s 'sk-ant-')",
-            "paths.source": "Putanja do mape s ugovorima",
-        }
-        for key, tip_text in _tooltips.items():
-            widget = entry_widgets.get(key)
-            if widget:
-                ToolTip(widget, tip_text)
-
     def _pick_folder(self, var: tk.StringVar) -> None:
         path = filedialog.askdirectory(title="Odaberite mapu")
         if path:
@@ -1229,7 +1756,7 @@ class PipelineGUI:
         """Write pipeline.toml and .env from form values."""
         # M31: Validate fields before saving
         oib = entries["general.company_oib"].get().strip()
-        if oib and not re.match(r"^\d{11}$", oib):
+        if oib and not _OIB_RE.match(oib):
             messagebox.showwarning(
                 "Neispravan OIB",
                 "OIB mora sadr\u017eavati to\u010dno 11 znamenki.",
@@ -1237,7 +1764,7 @@ class PipelineGUI:
             return
 
         eff_date = entries["generation.default_effective_date"].get().strip()
-        if eff_date and not re.match(r"^\d{4}-\d{2}-\d{2}$", eff_date):
+        if eff_date and not _DATE_RE.match(eff_date):
             messagebox.showwarning(
                 "Neispravan datum",
                 "Datum mora biti u formatu GGGG-MM-DD.",
@@ -1264,41 +1791,45 @@ class PipelineGUI:
             return
 
         try:
-            toml_lines = [
-                "[general]",
-                f'company_name = "{entries["general.company_name"].get()}"',
-                f'company_oib = "{oib}"',
-                f'company_address = "{entries["general.company_address"].get()}"',
-                f'company_director = "{entries["general.company_director"].get()}"',
-                'default_location = "Zagreb"',
-                "",
-                "[paths]",
-                f'source = "{entries["paths.source"].get()}"',
-                'working_dir = "./data"',
-                'output_dir = "./output"',
-                'template = "./templates/default/aneks_template.docx"',
-                "",
-                "[extraction]",
-                'model = "claude-sonnet-4-6-20250514"',
-                "use_batch_api = true",
-                'confidence_threshold = "medium"',
-                "",
-                "[currency]",
-                "hrk_to_eur_rate = 7.53450",
-                'default_currency = "EUR"',
-                "",
-                "[generation]",
-                f'default_effective_date = "{eff_date}"',
-                'vat_note = "Sve cijene su izra\u017eene bez PDV-a."',
-                "",
-            ]
-
-            toml_path = _PROJECT_ROOT / "pipeline.toml"
-            toml_path.write_text("\n".join(toml_lines), encoding="utf-8")
+            import tomli_w
+
+            generation: dict[str, Any] = {"vat_note": "Sve cijene su izra\u017eene bez PDV-a."}
+            if eff_date:
+                # Empty means "use the built-in default" — "" would not load
+                generation = {"default_effective_date": eff_date, **generation}
+            data = {
+                "general": {
+                    "company_name": entries["general.company_name"].get(),
+                    "company_oib": oib,
+                    "company_address": entries["general.company_address"].get(),
+                    "company_director": entries["general.company_director"].get(),
+                    "default_location": "Zagreb",
+                },
+                "paths": {
+                    "source": entries["paths.source"].get(),
+                    "working_dir": "./data",
+                    "output_dir": "./output",
+                    "template": "./templates/default/aneks_template.docx",
+                },
+                "extraction": {
+                    "model": "claude-sonnet-4-6-20250514",
+                    "use_batch_api": True,
+                    "confidence_threshold": "medium",
+                },
+                "currency": {
+                    "hrk_to_eur_rate": 7.53450,
+                    "default_currency": "EUR",
+                },
+                "generation": generation,
+            }
+
+            # tomli_w escapes quotes/backslashes in names and Windows paths
+            _atomic_write(_PROJECT_ROOT / "pipeline.toml", tomli_w.dumps(data).encode("utf-8"))
 
             # Write .env
-            env_path = _PROJECT_ROOT / ".env"
-            env_path.write_text(f"ANTHROPIC_API_KEY={api_key}\n", encoding="utf-8")
+            _atomic_write(_PROJECT_ROOT / ".env", f"ANTHROPIC_API_KEY={api_key}\n".encode("utf-8"))
+            self._invalidate_availability()
+            self._invalidate_step_frames()
 
             self._set_status("Postavke spremljene")
             self._show_banner("Postavke uspje\u0161no spremljene.", "success")
@@ -1322,9 +1853,8 @@ class PipelineGUI:
         self._api_test_btn.configure(state=tk.DISABLED)
         self._api_test_status.configure(text="Testiranje...", foreground="#3498db")
 
-        # Use a dedicated queue to avoid conflicts with main pipeline queue
-        api_queue: queue.Queue[tuple[str, Any]] = queue.Queue()
-
+        # The result is handed back through _post_ui (kept separate from the
+        # pipeline's message queue)
         def _do_test() -> None:
             try:
                 import anthropic
@@ -1335,37 +1865,31 @@ class PipelineGUI:
                     max_tokens=10,
                     messages=[{"role": "user", "content": "Hi"}],
                 )
-                api_queue.put(("api_test_ok", None))
+                msg: tuple[str, Any] = ("api_test_ok", None)
             except Exception as exc:
                 exc_type = type(exc).__name__
-                api_queue.put(("api_test_fail", f"{exc_type}: {exc}"))
+                msg = ("api_test_fail", f"{exc_type}: {exc}")
+            self._post_ui(functools.partial(self._on_api_test_done, msg))
 
-        def _poll_api_test() -> None:
-            try:
-                msg = api_queue.get_nowait()
-                self._api_test_btn.configure(state=tk.NORMAL)
-                if msg[0] == "api_test_ok":
-                    self._api_test_status.configure(
-                        text="Uspjeh!", foreground="#27ae60"
-                    )
-                else:
-                    err_msg = msg[1] if len(msg) > 1 else "Nepoznata greška"
-                    if "AuthenticationError" in str(err_msg):
-                        self._api_test_status.configure(
-                            text="Nevaljan", foreground="#e74c3c"
-                        )
-                    else:
-                        self._api_test_status.configure(
-                            text="Gre\u0161ka", foreground="#e74c3c"
-                        )
-                    self._show_banner(f"Gre\u0161ka pri testiranju API-ja: {err_msg}", "error")
-                return
-            except queue.Empty:
-                pass
-            self.root.after(200, _poll_api_test)
+        self._start_worker(_do_test)
 
-        threading.Thread(target=_do_test, daemon=True).start()
-        _poll_api_test()
+    def _on_api_test_done(self, msg: tuple[str, Any]) -> None:
+        self._api_test_btn.configure(state=tk.NORMAL)
+        if msg[0] == "api_test_ok":
+            self._api_test_status.configure(
+                text="Uspjeh!", foreground="#27ae60"
+            )
+        else:
+            err_msg = msg[1] if len(msg) > 1 else "Nepoznata greška"
+            if "AuthenticationError" in str(err_msg):
+                self._api_test_status.configure(
+                    text="Nevaljan", foreground="#e74c3c"
+                )
+            else:
+                self._api_test_status.configure(
+                    text="Gre\u0161ka", foreground="#e74c3c"
+                )
+            self._show_banner(f"Gre\u0161ka pri testiranju API-ja: {err_msg}", "error")
 
     # ── Step 1: Setup ────────────────────────────────────────────────────
 
@@ -1376,24 +1900,14 @@ class PipelineGUI:
             "Skeniranje i kopiranje ugovora",
         )
 
-        # Show inventory status if it exists (quiet config load during UI build)
-        cfg = self._load_config_safe(quiet=True)
+        # Quiet config load during UI build
+        self._load_config_safe(quiet=True)
         self._add_config_warning(parent)
 
-        if cfg and cfg.inventory_path.exists():
-            try:
-                from doc_pipeline.models import Inventory
-                inv = Inventory.load(cfg.inventory_path)
-                info = (
-                    f"Postoje\u0107i inventar: {inv.total_clients} klijenata, "
-                    f"{inv.clients_with_contracts} s ugovorima, "
-                    f"{inv.clients_with_annexes} s aneksima"
-                )
-                ttk.Label(parent, text=info, foreground="#27ae60").pack(
-                    anchor=tk.W, pady=(0, 8)
-                )
-            except Exception:
-                pass
+        # Inventory status, refilled when the kept view is shown again
+        self._setup_info = ttk.Frame(parent)
+        self._setup_info.pack(fill=tk.X)
+        self._refresh_setup_info()
 
         # ── Primary action ──
         primary_frame = ttk.Frame(parent)
@@ -1439,6 +1953,28 @@ class PipelineGUI:
         self._setup_progress, self._setup_pct = self._add_progress(parent)
         self._setup_log = self._add_log_area(parent, step_name="setup")
 
+    def _refresh_setup_info(self) -> None:
+        """Show the existing inventory's counts, if there is one."""
+        for child in list(self._setup_info.children.values()):
+            child.destroy()
+        cfg = self._load_config_safe(quiet=True)
+        if not cfg:
+            return
+        # No separate exists() probe: a missing inventory just fails to load
+        try:
+            from doc_pipeline.models import Inventory
+            inv = Inventory.load(cfg.inventory_path)
+        except Exception:
+            return
+        info = (
+            f"Postoje\u0107i inventar: {inv.total_clients} klijenata, "
+            f"{inv.clients_with_contracts} s ugovorima, "
+            f"{inv.clients_with_annexes} s aneksima"
+        )
+        ttk.Label(self._setup_info, text=info, foreground="#27ae60").pack(
+            anchor=tk.W, pady=(0, 8)
+        )
+
     def _run_setup(self, scan_only: bool = False) -> None:
         if self._running:
             return
@@ -1471,7 +2007,7 @@ class PipelineGUI:
             finally:
                 self._buffered.restore()
 
-        threading.Thread(target=task, daemon=True).start()
+        self._tasks.submit(task)
         self._poll_queue(self._setup_log, self._setup_progress, self._on_setup_done, self._setup_pct)
 
     def _on_setup_done(self, msg_type: str, data: Any) -> None:
@@ -1479,11 +2015,19 @@ class PipelineGUI:
         self._setup_pct.set("")
         self._setup_progress.configure(mode="indeterminate")
         self._running = False
+        self._invalidate_step_frames()
         self._setup_btn.configure(state=tk.NORMAL)
         self._setup_rescan_btn.configure(state=tk.NORMAL)
-        if hasattr(self, "_setup_cancel_btn") and self._setup_cancel_btn.winfo_exists():
+        if self._live_widget("_setup_cancel_btn") is not None:
             self._setup_cancel_btn.configure(state=tk.DISABLED)
 
+        # A finished setup has saved the inventory, which is all Extraction
+        # needs; after a cancel or error, look at the disk again
+        if msg_type == "setup_done":
+            self._mark_available(2)
+        else:
+            self._invalidate_availability()
+
         if msg_type == "setup_cancelled":
             self._set_status("Priprema otkazana")
             self._log_append(
@@ -1513,6 +2057,7 @@ class PipelineGUI:
             )
             # Update sidebar availability after setup completes
             self._update_sidebar()
+            self._refresh_setup_info()
             # M34: Next step affordance
             self._add_next_step_button(self._content_frame, 2)
         else:
@@ -1529,36 +2074,15 @@ class PipelineGUI:
             "Čitanje ugovora i izvlačenje cijena",
         )
 
-        # Show extraction status (quiet config load during UI build)
-        cfg = self._load_config_safe(quiet=True)
+        # Quiet config load during UI build
+        self._load_config_safe(quiet=True)
         self._add_config_warning(parent)
 
-        # L8: Show which clients were extracted
-        if cfg and cfg.extractions_path.exists():
-            json_files = sorted(cfg.extractions_path.glob("*.json"))
-            n_extracted = len(json_files)
-            if n_extracted > 0:
-                # Build list of extracted client names from filenames
-                client_names = [f.stem for f in json_files]
-                if len(client_names) > 10:
-                    display_names = ", ".join(client_names[:10])
-                    display_names += f" ... i još {len(client_names) - 10}"
-                else:
-                    display_names = ", ".join(client_names)
-
-                ttk.Label(
-                    parent,
-                    text=f"Već ekstrahirano: {n_extracted} klijenata",
-                    foreground="#27ae60",
-                ).pack(anchor=tk.W, pady=(0, 2))
-                ttk.Label(
-                    parent,
-                    text=display_names,
-                    foreground="#7f8c8d",
-                    font=("Arial", 9),
-                    wraplength=700,
-                    justify=tk.LEFT,
-                ).pack(anchor=tk.W, pady=(0, 8))
+        # L8: Which clients were extracted, refilled when the kept view is
+        # shown again
+        self._extract_info = ttk.Frame(parent)
+        self._extract_info.pack(fill=tk.X)
+        self._refresh_extraction_info()
 
         # F1: Client filter for extraction
         filter_frame = ttk.Frame(parent)
@@ -1636,6 +2160,37 @@ class PipelineGUI:
         self._extract_progress, self._extract_pct = self._add_progress(parent)
         self._extract_log = self._add_log_area(parent, step_name="extraction")
 
+    def _refresh_extraction_info(self) -> None:
+        """List the clients that already have an extraction."""
+        for child in list(self._extract_info.children.values()):
+            child.destroy()
+        cfg = self._load_config_safe(quiet=True)
+        if not cfg:
+            return
+        client_names = _extracted_client_names(cfg.extractions_path)
+        n_extracted = len(client_names)
+        if n_extracted == 0:
+            return
+        if n_extracted > 10:
+            display_names = ", ".join(client_names[:10])
+            display_names += f" ... i još {n_extracted - 10}"
+        else:
+            display_names = ", ".join(client_names)
+
+        ttk.Label(
+            self._extract_info,
+            text=f"Već ekstrahirano: {n_extracted} klijenata",
+            foreground="#27ae60",
+        ).pack(anchor=tk.W, pady=(0, 2))
+        ttk.Label(
+            self._extract_info,
+            text=display_names,
+            foreground="#7f8c8d",
+            font=("Arial", 9),
+            wraplength=700,
+            justify=tk.LEFT,
+        ).pack(anchor=tk.W, pady=(0, 8))
+
     def _run_extraction(
         self, force: bool = False, spreadsheet_only: bool = False
     ) -> None:
@@ -1645,7 +2200,7 @@ class PipelineGUI:
         if cfg is None:
             return
 
-        if not cfg.inventory_path.exists():
+        if not self._exists_cached(cfg.inventory_path):
             messagebox.showwarning(
                 "Nedostaje inventar",
                 "Inventar nije pronađen. Pokrenite najprije korak 'Priprema'.",
@@ -1655,9 +2210,7 @@ class PipelineGUI:
         # F1: Parse client filter
         client_names: list[str] | None = None
         if self._extract_clients_var:
-            raw = self._extract_clients_var.get().strip()
-            if raw:
-                client_names = [c.strip() for c in raw.split(",") if c.strip()]
+            client_names = list(_parse_client_filter(self._extract_clients_var.get())) or None
 
         # M32: Re-extract confirmation for force mode
         if force:
@@ -1701,7 +2254,7 @@ class PipelineGUI:
             finally:
                 self._buffered.restore()
 
-        threading.Thread(target=task, daemon=True).start()
+        self._tasks.submit(task)
         self._poll_queue(self._extract_log, self._extract_progress, self._on_extract_done, self._extract_pct)
 
     def _on_extract_done(self, msg_type: str, data: Any) -> None:
@@ -1709,12 +2262,21 @@ class PipelineGUI:
         self._extract_pct.set("")
         self._extract_progress.configure(mode="indeterminate")
         self._running = False
+        self._invalidate_step_frames()
         self._extract_btn.configure(state=tk.NORMAL)
         self._extract_force_btn.configure(state=tk.NORMAL)
         self._extract_ss_btn.configure(state=tk.NORMAL)
-        if hasattr(self, "_extract_cancel_btn") and self._extract_cancel_btn.winfo_exists():
+        if self._live_widget("_extract_cancel_btn") is not None:
             self._extract_cancel_btn.configure(state=tk.DISABLED)
 
+        # A finished extraction with results has written the control
+        # spreadsheet that Review and Generation need; with none it writes
+        # nothing
+        if msg_type == "extract_done" and data > 0:
+            self._mark_available(3, 4)
+        else:
+            self._invalidate_availability()
+
         if msg_type == "extract_cancelled":
             self._set_status("Ekstrakcija otkazana")
             self._log_append(
@@ -1734,6 +2296,7 @@ class PipelineGUI:
             )
             # Update sidebar availability
             self._update_sidebar()
+            self._refresh_extraction_info()
             self._show_banner(
                 f"Ekstrakcija završena — {n} klijenata. Otvorite tablicu u koraku Pregled.",
                 "success",
@@ -1810,9 +2373,7 @@ class PipelineGUI:
         ttk.Label(selector_frame, text="Klijent:", font=("Arial", 10)).pack(side=tk.LEFT)
 
         cfg = self._load_config_safe(quiet=True)
-        client_list: list[str] = []
-        if cfg and cfg.extractions_path.exists():
-            client_list = sorted(f.stem for f in cfg.extractions_path.glob("*.json"))
+        client_list = _extracted_client_names(cfg.extractions_path) if cfg else []
 
         self._review_client_var = tk.StringVar()
         client_combo = ttk.Combobox(
@@ -1823,12 +2384,12 @@ class PipelineGUI:
             width=40,
         )
         client_combo.pack(side=tk.LEFT, padx=(8, 0))
-        client_combo.bind("<<ComboboxSelected>>", lambda e: self._show_client_preview())
+        client_combo.bind("<<ComboboxSelected>>", lambda e: self._schedule_client_preview())
 
         self._review_preview_text = tk.Text(
             preview_frame,
             wrap=tk.WORD,
-            font=("Consolas" if sys.platform == "win32" else "Menlo", 10),
+            font=_FIXED_FONT,
             bg="#fdf6e3",
             fg="#586e75",
             height=8,
@@ -1843,7 +2404,7 @@ class PipelineGUI:
         cfg = self._load_config_safe()
         if cfg is None:
             return
-        if not cfg.spreadsheet_path.exists():
+        if not self._exists_cached(cfg.spreadsheet_path):
             messagebox.showwarning(
                 "Tablica nije pronađena",
                 "Kontrolna tablica ne postoji.\nPokrenite najprije korak 'Ekstrakcija'.",
@@ -1853,75 +2414,123 @@ class PipelineGUI:
 
     # ── F2: Per-client extraction preview ─────────────────────────────────
 
+    def _schedule_client_preview(self) -> None:
+        """Debounce selections: arrowing through the list loads only where it stops."""
+        if self._preview_after is not None:
+            self.root.after_cancel(self._preview_after)
+        self._preview_after = self.root.after(120, self._show_client_preview)
+
     def _show_client_preview(self) -> None:
         """Show extraction summary for the selected client."""
+        self._preview_after = None
         client_name = self._review_client_var.get()
         if not client_name:
             return
+        self._preview_seq += 1
+        seq = self._preview_seq
 
         cfg = self._load_config_safe(quiet=True)
         if not cfg:
             return
 
         json_path = cfg.extractions_path / f"{client_name}.json"
-        if not json_path.exists():
+        try:
+            mtime_ns = json_path.stat().st_mtime_ns
+        except OSError:
             self._set_review_preview(f"Datoteka nije pronađena:\n{json_path}")
             return
 
-        try:
-            data = json.loads(json_path.read_text(encoding="utf-8"))
+        # Switching back to a client shows the text built last time, as long
+        # as its JSON has not been rewritten since
+        cached = self._preview_cache.get(json_path)
+        if cached is not None and cached[0] == mtime_ns:
+            self._preview_cache.move_to_end(json_path)
+            self._set_review_preview(cached[1])
+            return
 
-            # Extraction data is nested under the 'extraction' key
-            ex = data.get("extraction") or {}
+        # Read and parse off the Tk thread; large extraction files would
+        # otherwise freeze the window
+        self._set_review_preview("Učitavanje...")
 
-            lines: list[str] = []
-            lines.append(f"Klijent: {ex.get('client_name') or client_name}")
-            lines.append(f"OIB: {ex.get('client_oib') or 'N/A'}")
-            lines.append(
-                f"Broj ugovora: "
-                f"{ex.get('contract_number') or ex.get('parent_contract_number') or 'N/A'}"
-            )
-            lines.append(f"Datum: {ex.get('document_date') or 'N/A'}")
-            lines.append(
-                f"Pouzdanost: {ex.get('confidence') or 'N/A'}"
-            )
-            lines.append(f"Valuta: {ex.get('currency') or 'N/A'}")
-            lines.append(f"Izvorni dokument: {data.get('source_file') or 'N/A'}")
-
-            # Show pricing items
-            items = ex.get("pricing_items", [])
-            lines.append(f"\nStavke ({len(items)}):")
-            lines.append("-" * 50)
-            for item in items:
-                name = item.get("service_name", "?")
-                price = item.get("price_value", item.get("price_raw", "?"))
-                currency = item.get("currency", ex.get("currency", ""))
-                unit = item.get("unit") or item.get("designation") or ""
-                lines.append(f"  {name}: {price} {currency} {f'/ {unit}' if unit else ''}")
-
-            # Show notes
-            notes = ex.get("notes", [])
-            if notes:
-                notes_str = "; ".join(notes) if isinstance(notes, list) else str(notes)
-                lines.append(f"\nNapomene: {notes_str}")
-
-            # Show error if extraction failed
-            error = data.get("error")
-            if error:
-                lines.append(f"\n[GREŠKA]: {error}")
-
-            self._set_review_preview("\n".join(lines))
-        except Exception as exc:
-            self._set_review_preview(
-                f"Greška pri čitanju:\n{exc}"
+        def _load() -> None:
+            try:
+                data = orjson.loads(json_path.read_bytes())
+                result = (True, self._render_client_preview(client_name, data))
+            except Exception as exc:
+                result = (False, f"Greška pri čitanju:\n{exc}")
+            self._post_ui(
+                functools.partial(self._on_preview_loaded, seq, json_path, mtime_ns, *result)
             )
 
+        self._start_worker(_load)
+
+    def _on_preview_loaded(
+        self, seq: int, json_path: Path, mtime_ns: int, ok: bool, text: str
+    ) -> None:
+        if ok:
+            self._preview_cache[json_path] = (mtime_ns, text)
+            self._preview_cache.move_to_end(json_path)
+            if len(self._preview_cache) > _PREVIEW_CACHE_SIZE:
+                self._preview_cache.popitem(last=False)
+        # Show it only if no other client was picked in the meantime
+        if seq == self._preview_seq and self._live_widget("_review_preview_text") is not None:
+            self._set_review_preview(text)
+
+    @staticmethod
+    def _render_client_preview(client_name: str, data: dict[str, Any]) -> str:
+        """Extraction summary text for one client's extraction JSON."""
+        # Extraction data is nested under the 'extraction' key
+        ex = data.get("extraction") or {}
+
+        lines: list[str] = []
+        lines.append(f"Klijent: {ex.get('client_name') or client_name}")
+        lines.append(f"OIB: {ex.get('client_oib') or 'N/A'}")
+        lines.append(
+            f"Broj ugovora: "
+            f"{ex.get('contract_number') or ex.get('parent_contract_number') or 'N/A'}"
+        )
+        lines.append(f"Datum: {ex.get('document_date') or 'N/A'}")
+        lines.append(
+            f"Pouzdanost: {ex.get('confidence') or 'N/A'}"
+        )
+        lines.append(f"Valuta: {ex.get('currency') or 'N/A'}")
+        lines.append(f"Izvorni dokument: {data.get('source_file') or 'N/A'}")
+
+        # Show pricing items
+        items = ex.get("pricing_items", [])
+        lines.append(f"\nStavke ({len(items)}):")
+        lines.append("-" * 50)
+        default_currency = ex.get("currency", "")
+        lines += [
+            f"  {item.get('service_name', '?')}: "
+            f"{item.get('price_value', item.get('price_raw', '?'))} "
+            f"{item.get('currency', default_currency)} "
+            f"{'/ ' + unit if unit else ''}"
+            for item in items
+            for unit in (item.get("unit") or item.get("designation") or "",)
+        ]
+
+        # Show notes
+        notes = ex.get("notes", [])
+        if notes:
+            notes_str = "; ".join(notes) if isinstance(notes, list) else str(notes)
+            lines.append(f"\nNapomene: {notes_str}")
+
+        # Show error if extraction failed
+        error = data.get("error")
+        if error:
+            lines.append(f"\n[GREŠKA]: {error}")
+
+        return "\n".join(lines)
+
     def _set_review_preview(self, text: str) -> None:
         """Set the review preview text area content."""
-        self._review_preview_text.configure(state=tk.NORMAL)
-        self._review_preview_text.delete("1.0", tk.END)
-        self._review_preview_text.insert("1.0", text)
-        self._review_preview_text.configure(state=tk.DISABLED)
+        widget = self._review_preview_text
+        widget.configure(state=tk.NORMAL)
+        # One replace instead of delete + insert: a single relayout and no
+        # momentarily empty widget
+        widget.replace("1.0", "end-1c", text)
+        widget.configure(state=tk.DISABLED)
 
     # ── Step 4: Generation ───────────────────────────────────────────────
 
@@ -2071,7 +2680,7 @@ class PipelineGUI:
             cfg = self._load_config_safe()
             if cfg is None:
                 return
-            yy = datetime.now().strftime('%y')
+            yy = time.strftime('%y')
             detected = _detect_next_annex_number(cfg.annexes_output_path, cfg.source_path)
             self._auto_num_label.configure(
                 text=f"(automatski: U-{yy}-{detected:02d})"
@@ -2099,9 +2708,7 @@ class PipelineGUI:
     def _get_gen_client_names(self) -> list[str] | None:
         """Parse the client filter for the generation step (F1)."""
         if self._gen_clients_var:
-            raw = self._gen_clients_var.get().strip()
-            if raw:
-                return [c.strip() for c in raw.split(",") if c.strip()]
+            return list(_parse_client_filter(self._gen_clients_var.get())) or None
         return None
 
     def _run_preview(self) -> None:
@@ -2152,7 +2759,7 @@ class PipelineGUI:
             finally:
                 self._buffered.restore()
 
-        threading.Thread(target=task, daemon=True).start()
+        self._tasks.submit(task)
         self._poll_queue(self._gen_log, self._gen_progress, self._on_preview_done, self._gen_pct)
 
     def _on_preview_done(self, msg_type: str, data: Any) -> None:
@@ -2162,7 +2769,7 @@ class PipelineGUI:
         self._running = False
         self._gen_preview_btn.configure(state=tk.NORMAL)
         self._gen_btn.configure(state=tk.NORMAL)
-        if hasattr(self, "_gen_cancel_btn") and self._gen_cancel_btn.winfo_exists():
+        if self._live_widget("_gen_cancel_btn") is not None:
             self._gen_cancel_btn.configure(state=tk.DISABLED)
 
         if msg_type == "preview_cancelled":
@@ -2174,9 +2781,9 @@ class PipelineGUI:
             self._set_status("Pregled zavr\u0161en")
             self._show_banner("Pregled zavr\u0161en. Provjerite zapisnik.", "info")
             # Swap: "Generiraj" becomes primary, "Pregledaj" becomes secondary
-            if hasattr(self, '_gen_btn') and self._gen_btn.winfo_exists():
+            if self._live_widget("_gen_btn") is not None:
                 self._restyle_button(self._gen_btn, "primary")
-            if hasattr(self, '_gen_preview_btn') and self._gen_preview_btn.winfo_exists():
+            if self._live_widget("_gen_preview_btn") is not None:
                 self._restyle_button(self._gen_preview_btn, "secondary")
         else:
             self._set_status("Pregled neuspio")
@@ -2237,7 +2844,7 @@ class PipelineGUI:
             finally:
                 self._buffered.restore()
 
-        threading.Thread(target=task, daemon=True).start()
+        self._tasks.submit(task)
         self._poll_queue(self._gen_log, self._gen_progress, self._on_gen_done, self._gen_pct)
 
     def _on_gen_done(self, msg_type: str, data: Any) -> None:
@@ -2245,9 +2852,11 @@ class PipelineGUI:
         self._gen_pct.set("")
         self._gen_progress.configure(mode="indeterminate")
         self._running = False
+        # The annexes folder may exist now
+        self._exists_cache.clear()
         self._gen_preview_btn.configure(state=tk.NORMAL)
         self._gen_btn.configure(state=tk.NORMAL)
-        if hasattr(self, "_gen_cancel_btn") and self._gen_cancel_btn.winfo_exists():
+        if self._live_widget("_gen_cancel_btn") is not None:
             self._gen_cancel_btn.configure(state=tk.DISABLED)
 
         if msg_type == "gen_cancelled":
@@ -2285,7 +2894,7 @@ class PipelineGUI:
             folder = cfg.source_path
         else:
             folder = cfg.annexes_output_path
-            if not folder.exists():
+            if not self._exists_cached(folder):
                 folder = cfg.output_path
         self._open_file(folder)
 
@@ -2298,33 +2907,100 @@ class PipelineGUI:
         done_callback: Any,
         pct_var: tk.StringVar | None = None,
     ) -> None:
-        """Poll for background thread messages and buffered console output."""
-        # Check for buffered console output
-        new_text = self._buffered.read_new()
-        if new_text:
-            self._log_append(log_widget, new_text)
+        """Feed background thread messages and console output into these widgets."""
+        self._poll_ctx = (log_widget, progress_bar, done_callback, pct_var)
+        self._pump()
 
-        # Check message queue
-        try:
-            msg = self._queue.get_nowait()
-            msg_type = msg[0]
+    def _schedule_pump(self, delay_ms: int) -> None:
+        if self._pump_after is None:
+            self._pump_after = self.root.after(delay_ms, self._scheduled_pump)
+
+    def _scheduled_pump(self) -> None:
+        self._pump_after = None
+        self._pump()
 
+    def _post_ui(self, fn: Any) -> None:
+        """Run *fn* on the Tk thread; callable from any thread."""
+        self._ui_calls.append(fn)
+        if self._waker is not None:
+            self._waker.wake()
+
+    def _run_ui_calls(self) -> None:
+        while self._ui_calls:
+            self._ui_calls.popleft()()
+
+    def _start_worker(self, target: Any) -> None:
+        """Run *target* in a daemon thread that reports back through _post_ui."""
+        done = threading.Event()
+
+        def _run() -> None:
+            try:
+                target()
+            finally:
+                done.set()
+
+        threading.Thread(target=_run, daemon=True).start()
+        if self._waker is None:
+            self.root.after(200, self._poll_ui_calls, done)
+
+    def _poll_ui_calls(self, done: threading.Event) -> None:
+        # Only without a waker: nothing else would run the posted callbacks
+        self._run_ui_calls()
+        if not done.is_set() or self._ui_calls:
+            self.root.after(200, self._poll_ui_calls, done)
+
+    def _pump(self) -> None:
+        """Move buffered console output and queued messages into the UI."""
+        self._run_ui_calls()
+        if self._poll_ctx is None:
+            return
+        log_widget, progress_bar, done_callback, pct_var = self._poll_ctx
+
+        # Check for buffered console output — bounded, so a burst of output
+        # cannot hold up the mainloop for a whole tick
+        new_text = self._buffered.read_new(_MAX_DRAIN_CHARS)
+        had_work = bool(new_text)
+        if new_text:
+            # Write it out in this tick, merged with anything else already
+            # queued for the log (one insert + see). Added to the pending
+            # chunks directly: _log_append would schedule an idle flush that
+            # would find nothing left to do.
+            self._log_pending.setdefault(str(log_widget), []).append(new_text)
+            self._flush_log(log_widget)
+
+        if self._buffered.has_pending():
+            # Drain the rest before handling queue messages, so a "done"
+            # message never overtakes the output that preceded it
+            self._schedule_pump(_DRAIN_BURST_MS)
+            return
+
+        # Drain the message queue. Only the latest progress update matters;
+        # anything else ends the task.
+        last_progress = None
+        terminal = None
+        while True:
+            try:
+                msg = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            had_work = True
             # H19: Handle progress updates
-            if msg_type == "progress" and len(msg) >= 3:
-                current, total = msg[1], msg[2]
-                self._update_progress(progress_bar, current, total, pct_var)
-                # Don't call done_callback for progress messages — keep polling
+            if msg[0] == "progress" and len(msg) >= 3:
+                last_progress = msg
             else:
-                done_callback(msg_type, msg[1] if len(msg) > 1 else None)
-                return
-        except queue.Empty:
-            pass
+                terminal = msg
+                break
 
-        # Continue polling
-        self.root.after(
-            100,
-            lambda: self._poll_queue(log_widget, progress_bar, done_callback, pct_var),
-        )
+        if last_progress is not None:
+            self._update_progress(progress_bar, last_progress[1], last_progress[2], pct_var)
+        if terminal is not None:
+            self._poll_ctx = None
+            done_callback(terminal[0], terminal[1] if len(terminal) > 1 else None)
+            return
+
+        if self._waker is None:
+            # No self-pipe: keep polling
+            self._schedule_pump(_POLL_BUSY_MS if had_work else _POLL_IDLE_MS)
 
     # ── Utility ──────────────────────────────────────────────────────────
 
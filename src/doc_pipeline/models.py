@@ -4,12 +4,14 @@ from __future__ import annotations
 
 import enum
 import json
+import marshal
 import os
 import unicodedata
 from datetime import datetime
 from decimal import Decimal
 from pathlib import Path
 
+import orjson
 from pydantic import BaseModel, Field, field_validator
 
 
@@ -102,6 +104,13 @@ class ClientEntry(BaseModel):
             return unicodedata.normalize('NFC', v)
         return v
 
+    @property
+    def doc_types(self) -> frozenset[str]:
+        """doc_type values of the currently selected files."""
+        return frozenset(
+            f.doc_type.value for f in self.files if f.status == FileStatus.SELECTED
+        )
+
     @property
     def selected_files(self) -> list[FileEntry]:
         return [f for f in self.files if f.status == FileStatus.SELECTED]
@@ -156,9 +165,75 @@ class Inventory(BaseModel):
         tmp.write_text(self.model_dump_json(indent=2), encoding="utf-8")
         os.replace(str(tmp), str(path))
 
+        # Binary sidecar for load_trusted(); written after the JSON so its
+        # mtime marks it as current. The JSON stays the source of truth.
+        sidecar = _sidecar_path(path)
+        tmp = sidecar.with_suffix('.tmp')
+        tmp.write_bytes(marshal.dumps(self.model_dump(mode="json")))
+        os.replace(str(tmp), str(sidecar))
+
     @classmethod
     def load(cls, path: Path) -> Inventory:
-        return cls.model_validate_json(path.read_text(encoding="utf-8"))
+        return cls.model_validate_json(path.read_bytes())
+
+    @classmethod
+    def load_trusted(cls, path: Path) -> Inventory:
+        """Load an inventory written by :meth:`save` without re-validating it.
+
+        For read-only display (``pipeline status`` / ``inventory``). Nested
+        models are built with ``model_construct``, so field validators (NFC
+        normalization) and type coercion are skipped — only enums and
+        datetimes are rebuilt. Use :meth:`load` for anything that mutates
+        or re-saves the inventory.
+
+        Reads the marshal sidecar written by :meth:`save` when it is at least
+        as new as the JSON, and falls back to the JSON otherwise.
+        """
+        data = _load_sidecar(path)
+        if data is None:
+            data = orjson.loads(path.read_bytes())
+        if data.get("created_at"):
+            data["created_at"] = datetime.fromisoformat(data["created_at"])
+        data["clients"] = [_construct_client(c) for c in data.get("clients", [])]
+        return cls.model_construct(**data)
+
+
+def _sidecar_path(path: Path) -> Path:
+    return path.with_suffix(".marshal")
+
+
+def _load_sidecar(path: Path) -> dict | None:
+    """Inventory data from the marshal sidecar, or None if missing or stale."""
+    sidecar = _sidecar_path(path)
+    try:
+        if sidecar.stat().st_mtime_ns < path.stat().st_mtime_ns:
+            return None  # JSON edited (or re-written) after the sidecar
+        data = marshal.loads(sidecar.read_bytes())
+    except (OSError, EOFError, ValueError, TypeError):
+        # Missing file, or written by an incompatible Python version
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def _construct_file(d: dict) -> FileEntry:
+    """Build a FileEntry from trusted JSON data without validation."""
+    if d.get("modified_date"):
+        d["modified_date"] = datetime.fromisoformat(d["modified_date"])
+    if "doc_type" in d:
+        d["doc_type"] = DocType(d["doc_type"])
+    if "status" in d:
+        d["status"] = FileStatus(d["status"])
+    return FileEntry.model_construct(**d)
+
+
+def _construct_client(d: dict) -> ClientEntry:
+    """Build a ClientEntry (and its files/chain) from trusted JSON data."""
+    if "status" in d:
+        d["status"] = ClientStatus(d["status"])
+    d["files"] = [_construct_file(f) for f in d.get("files", [])]
+    if d.get("document_chain") is not None:
+        d["document_chain"] = DocumentChain.model_construct(**d["document_chain"])
+    return ClientEntry.model_construct(**d)
 
 
 # ── Phase 1: Extraction models ──────────────────────────────────────────────
@@ -5,6 +5,7 @@ from __future__ import annotations
 import logging
 import re
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 
@@ -67,6 +68,13 @@ Key instructions:
 - The document_date should be the signing/effective date found in the document header.
 """
 
+# Tools + system prompt are identical for every document, so the cache
+# breakpoint on the system block lets the API reuse that whole prefix
+# across requests (and across the requests of one batch).
+SYSTEM_BLOCKS = [
+    {"type": "text", "text": SYSTEM_PROMPT, "cache_control": {"type": "ephemeral"}},
+]
+
 USER_PROMPT_TEMPLATE = """\
 Extract the structured pricing data from the following Croatian contract document.
 The document belongs to client folder: "{folder_name}".
@@ -221,6 +229,7 @@ def _parse_extraction_response(tool_input: dict) -> ExtractionResult:
 
 MAX_RETRIES = 3
 RETRY_DELAY = 2  # seconds, doubles each retry
+SYNC_MAX_WORKERS = 4  # concurrent API calls in sync mode
 
 _RETRYABLE_ERRORS = (
     anthropic.RateLimitError,
@@ -259,7 +268,7 @@ def _extract_sync(
             response = client.messages.create(
                 model=model,
                 max_tokens=4096,
-                system=SYSTEM_PROMPT,
+                system=SYSTEM_BLOCKS,
                 tools=[tool],
                 tool_choice={"type": "tool", "name": "extract_contract_data"},
                 messages=[
@@ -335,7 +344,7 @@ def _extract_batch(
             "params": {
                 "model": model,
                 "max_tokens": 4096,
-                "system": SYSTEM_PROMPT,
+                "system": SYSTEM_BLOCKS,
                 "tools": [tool],
                 "tool_choice": {"type": "tool", "name": "extract_contract_data"},
                 "messages": [
@@ -499,7 +508,8 @@ def run_extraction(
         config: Pipeline configuration.
         force: Re-extract even if JSON already exists.
         client_names: Process only these clients (by folder name).
-        sync_mode: Use sync API instead of batch.
+        sync_mode: Use sync API instead of batch, regardless of
+            ``extraction.use_batch_api`` in the config.
         skip_conversion: Skip .doc → .docx conversion.
         spreadsheet_only: Only regenerate spreadsheet from existing extractions.
     """
@@ -635,7 +645,7 @@ def run_extraction(
         # ── Step 2: Call Claude API ──────────────────────────────────────
         extractions: list[ClientExtraction] = []
 
-        if sync_mode:
+        if sync_mode or not config.extraction.use_batch_api:
             extractions = _run_sync_extraction(
                 api_client, config, texts,
             )
@@ -674,43 +684,57 @@ def _run_sync_extraction(
     config: PipelineConfig,
     texts: dict[str, tuple[str, str, str, bool]],
 ) -> list[ClientExtraction]:
-    """Run extraction in sync mode (one API call per client)."""
-    extractions: list[ClientExtraction] = []
-
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        BarColumn(),
-        TaskProgressColumn(),
-        TimeElapsedColumn(),
-    ) as progress:
-        task = progress.add_task("Claude API extraction...", total=len(texts))
-
-        for folder, (text, source_file, ext, was_conv) in texts.items():
-            progress.update(task, advance=1, description=f"API: {folder}")
+    """Run extraction in sync mode (one API call per client).
 
-            ce = ClientExtraction(
-                folder_name=folder,
-                source_file=source_file,
-                source_extension=ext,
-                was_converted=was_conv,
-                extracted_at=datetime.now(),
-            )
+    Calls are I/O-bound, so up to SYNC_MAX_WORKERS run concurrently on a
+    thread pool; results are saved from this thread as they complete.
+    """
+    extractions: list[ClientExtraction] = []
+    pool = ThreadPoolExecutor(max_workers=SYNC_MAX_WORKERS)
 
-            try:
-                result = _extract_sync(
-                    api_client, config.extraction.model, folder, text,
+    try:
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            TaskProgressColumn(),
+            TimeElapsedColumn(),
+        ) as progress:
+            task = progress.add_task("Claude API extraction...", total=len(texts))
+
+            futures = {
+                pool.submit(_extract_sync, api_client, config.extraction.model, folder, text): folder
+                for folder, (text, _source_file, _ext, _was_conv) in texts.items()
+            }
+
+            for future in as_completed(futures):
+                folder = futures[future]
+                text, source_file, ext, was_conv = texts[folder]
+                progress.update(task, advance=1, description=f"API: {folder}")
+
+                ce = ClientExtraction(
+                    folder_name=folder,
+                    source_file=source_file,
+                    source_extension=ext,
+                    was_converted=was_conv,
+                    extracted_at=datetime.now(),
                 )
-                result.raw_text_length = len(text)
-                ce.extraction = result
-            except Exception as e:
-                ce.error = str(e)
-                _progress.console.print(f"    [red]Error ({folder}): {e}[/red]")
 
-            # Save per-client JSON
-            json_path = config.extractions_path / f"{folder}.json"
-            ce.save(json_path)
-            extractions.append(ce)
+                try:
+                    result = future.result()
+                    result.raw_text_length = len(text)
+                    ce.extraction = result
+                except Exception as e:
+                    ce.error = str(e)
+                    _progress.console.print(f"    [red]Error ({folder}): {e}[/red]")
+
+                # Save per-client JSON
+                json_path = config.extractions_path / f"{folder}.json"
+                ce.save(json_path)
+                extractions.append(ce)
+    finally:
+        # Drop queued requests if we are bailing out early (e.g. Ctrl+C)
+        pool.shutdown(wait=True, cancel_futures=True)
 
     return extractions
 
@@ -5,6 +5,7 @@ from __future__ import annotations
 import logging
 import re
 import unicodedata
+import zipfile
 from dataclasses import dataclass, field
 from datetime import date, datetime
 from decimal import Decimal, InvalidOperation, ROUND_HALF_UP
@@ -922,12 +923,12 @@ def run_generation(
     # ── Filter by client names if provided ──────────────────────────
     if client_names:
         # Match on folder name (case-insensitive, partial match)
+        needles = [name.lower() for name in client_names]
         filtered = []
         for ac in approved_list:
-            for name in client_names:
-                if name.lower() in ac.folder_name.lower():
-                    filtered.append(ac)
-                    break
+            folder = ac.folder_name.lower()
+            if any(n in folder for n in needles):
+                filtered.append(ac)
         if not filtered:
             _progress.console.print(
                 f"[yellow]None of the specified clients ({', '.join(client_names)}) "
@@ -1117,20 +1118,59 @@ REQUIRED_VARIABLES = {
     "mjesto",
 }
 
+# Parts of the .docx that docxtpl renders
+_TEMPLATE_PART_RE = re.compile(r"word/(document|header\d*|footer\d*)\.xml")
+# Word splits text into runs, so a tag can be broken up by XML markup
+_XML_TAG_RE = re.compile(r"<[^>]*>")
+# {{ name }}, {{ name.attr }}, {{ name|filter }} → name
+_PLACEHOLDER_RE = re.compile(r"\{\{-?\s*([A-Za-z_]\w*)")
+# {% if name %}, {%p elif not name %}, {%tr for x in name %} → (x, name)
+_BLOCK_RE = re.compile(
+    r"\{%-?(?:p|tr|tc|r)?\s*(?:if|elif|for\s+([A-Za-z_]\w*)\s+in)\s+(?:not\s+)?([A-Za-z_]\w*)"
+)
+
+
+def _scan_template_variables(template_path: Path) -> set[str]:
+    """Top-level variable names used in the template, found by a regex scan.
+
+    Covers the tag forms our templates use; for arbitrary Jinja2 expressions
+    use ``validate_template(..., strict=True)``.
+    """
+    with zipfile.ZipFile(template_path) as zf:
+        text = "".join(
+            _XML_TAG_RE.sub("", zf.read(name).decode("utf-8"))
+            for name in zf.namelist()
+            if _TEMPLATE_PART_RE.fullmatch(name)
+        )
+
+    found = set(_PLACEHOLDER_RE.findall(text))
+    loop_vars = set()
+    for loop_var, name in _BLOCK_RE.findall(text):
+        found.add(name)
+        if loop_var:
+            loop_vars.add(loop_var)
+    return found - loop_vars
 
-def validate_template(template_path: Path) -> tuple[bool, list[str]]:
+
+def validate_template(template_path: Path, *, strict: bool = False) -> tuple[bool, list[str]]:
     """Validate that the template contains all required Jinja2 variables.
 
+    By default the placeholders are found with a regex scan of the document
+    XML; ``strict=True`` parses the template with docxtpl/Jinja2 instead.
+
     Returns:
         (is_valid, list of issue messages)
     """
-    from docxtpl import DocxTemplate
-
     if not template_path.exists():
         return False, [f"Template file not found: {template_path}"]
 
-    tpl = DocxTemplate(str(template_path))
-    found = tpl.get_undeclared_template_variables()
+    if strict:
+        from docxtpl import DocxTemplate
+
+        tpl = DocxTemplate(str(template_path))
+        found = tpl.get_undeclared_template_variables()
+    else:
+        found = _scan_template_variables(template_path)
 
     issues = []
     missing = REQUIRED_VARIABLES - found
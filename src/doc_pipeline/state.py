@@ -77,7 +77,7 @@ class RunState(BaseModel):
 
     @classmethod
     def load(cls, path: Path) -> RunState:
-        return cls.model_validate_json(path.read_text(encoding="utf-8"))
+        return cls.model_validate_json(path.read_bytes())
 
 
 def get_run_dir(base: Path, run_id: str | None = None) -> Path: